@@ -42,6 +42,7 @@ from mocksmith.annotations import (
 
 # Import mock utilities
 try:
+    from mocksmith._random import seed, set_rng
     from mocksmith.decorators import mockable
     from mocksmith.mock_builder import MockBuilder
     from mocksmith.mock_factory import mock_factory
@@ -52,6 +53,8 @@ except ImportError:
     mockable = None  # type: ignore
     MockBuilder = None  # type: ignore
     mock_factory = None  # type: ignore
+    seed = None  # type: ignore
+    set_rng = None  # type: ignore
 
 # Core exports - Factory functions only (V3 pattern)
 __all__ = [
@@ -90,4 +93,4 @@ __all__ = [
 
 # Add mock utilities if available
 if MOCK_AVAILABLE:
-    __all__.extend(["MockBuilder", "mock_factory", "mockable"])
+    __all__.extend(["MockBuilder", "mock_factory", "mockable", "seed", "set_rng"])
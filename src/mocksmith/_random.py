@@ -0,0 +1,145 @@
+"""Shared random number generator and Faker instance for mock generation."""
+
+import random
+from importlib.util import find_spec
+from typing import Any, Callable
+
+# NumPy is imported on the first batched draw rather than with mocksmith, since
+# importing it costs more than the rest of the package
+NUMPY_AVAILABLE = find_spec("numpy") is not None
+
+# Single generator all mock generation draws from
+_rng = random.Random()
+
+# NumPy generator for batched draws, seeded from _rng on first use
+_np_rng: Any = None
+
+# Faker instance bound to _rng, created on first use
+_faker: Any = None
+
+# Callbacks run whenever the generator is replaced or reseeded
+_listeners: list[Callable[[random.Random], None]] = []
+
+
+def get_rng() -> random.Random:
+    """Return the generator mock generation draws from."""
+    return _rng
+
+
+def get_faker() -> Any:
+    """Return the shared Faker instance, creating it on first use.
+
+    Constructing Faker loads its providers, so every mock draws from this one
+    instance rather than building its own.
+
+    Raises:
+        ImportError: If faker is not installed
+    """
+    global _faker
+    if _faker is None:
+        try:
+            from faker import Faker  # pyright: ignore[reportMissingImports]
+        except ImportError as e:
+            raise ImportError(
+                "faker library is required for mock generation. "
+                "Install with: pip install mocksmith[mock]"
+            ) from e
+        _faker = Faker()
+        _faker.random = _rng
+    return _faker
+
+
+def add_listener(listener: Callable[[random.Random], None]) -> None:
+    """Register a callback run when the generator is replaced or reseeded.
+
+    Modules holding state derived from the generator, such as pools of
+    pre-drawn values, use this to stay in sync.
+
+    Args:
+        listener: Called with the current generator
+    """
+    _listeners.append(listener)
+    listener(_rng)
+
+
+def _notify() -> None:
+    global _np_rng
+    _np_rng = None
+    if _faker is not None:
+        _faker.random = _rng
+    for listener in _listeners:
+        listener(_rng)
+
+
+def set_rng(rng: random.Random) -> None:
+    """Replace the generator used for mock generation.
+
+    Args:
+        rng: A ``random.Random`` (or compatible) instance
+    """
+    global _rng
+    _rng = rng
+    _notify()
+
+
+def seed(value: Any = None) -> None:
+    """Seed the random generator shared by all mock generation.
+
+    Seeding makes every subsequent mock reproducible. A ``seed=`` keyword on
+    ``mock_factory`` is deliberately avoided because it would collide with a
+    field of the same name.
+
+    Args:
+        value: Seed value; None reseeds from system entropy
+    """
+    _rng.seed(value)
+    _notify()
+
+
+def _numpy_rng() -> Any:
+    """Return the NumPy generator, seeding it from the shared generator."""
+    global _np_rng
+    if _np_rng is None:
+        import numpy as np  # pyright: ignore[reportMissingImports]
+
+        _np_rng = np.random.default_rng(_rng.getrandbits(64))
+    return _np_rng
+
+
+def draw_indices(k: int, n: int) -> list[int]:
+    """Draw n uniform indices in range(k) in one batch.
+
+    Uses NumPy when installed, otherwise the shared generator.
+    """
+    if NUMPY_AVAILABLE:
+        return _numpy_rng().integers(0, k, size=n).tolist()
+    return _rng.choices(range(k), k=n)
+
+
+def draw_ints(low: int, high: int, n: int) -> list[int]:
+    """Draw n uniform integers in [low, high] in one batch.
+
+    Uses NumPy when installed, otherwise one randrange call per value, since
+    choices() scales a 53-bit float and skips values in wide ranges.
+    """
+    if NUMPY_AVAILABLE:
+        return _numpy_rng().integers(low, high, size=n, endpoint=True).tolist()
+    randrange = _rng.randrange
+    stop = high + 1
+    return [randrange(low, stop) for _ in range(n)]
+
+
+def draw_floats(n: int) -> list[float]:
+    """Draw n uniform floats in [0, 1) in one batch."""
+    if NUMPY_AVAILABLE:
+        return _numpy_rng().random(n).tolist()
+    random_ = _rng.random
+    return [random_() for _ in range(n)]
+
+
+def draw_bools(p: float, n: int) -> list[bool]:
+    """Draw n booleans in one batch, each True with probability p."""
+    if NUMPY_AVAILABLE:
+        return (_numpy_rng().random(n) < p).tolist()
+    random_ = _rng.random
+    return [random_() < p for _ in range(n)]
@@ -47,6 +47,11 @@ def mockable(
     """
 
     def decorator(cls: type[T]) -> type[T]:
+        # Already decorated with (at least) the requested methods
+        decorated = cls.__dict__.get("__mocksmith_mockable__")
+        if decorated is not None and (decorated or not builder):
+            return cls
+
         # Add mock() class method
         @classmethod
         def mock(cls, **overrides):
@@ -65,6 +70,7 @@ def mockable(
 
             cls.mock_builder = mock_builder
 
+        cls.__mocksmith_mockable__ = builder
         return cls
 
     # Handle both @mockable and @mockable() syntax
@@ -1,17 +1,97 @@
 """Type-safe builder pattern for mock data generation."""
 
 from dataclasses import fields, is_dataclass
-from typing import Any, Generic, TypeVar
+from typing import Any, Callable, Generic, TypeVar
+from weakref import WeakKeyDictionary
 
 T = TypeVar("T")
 
 
+def _field_types(target_class: type) -> list[tuple[str, Any]]:
+    """Return the (name, type) pairs a builder exposes setters for.
+
+    Args:
+        target_class: The class to inspect
+
+    Returns:
+        List of field names and their types
+    """
+    if is_dataclass(target_class):
+        # Handle dataclasses
+        return [(field.name, field.type) for field in fields(target_class)]
+    elif hasattr(target_class, "model_fields"):  # Pydantic v2
+        # Handle Pydantic v2 models
+        return [
+            (field_name, field_info.annotation)
+            for field_name, field_info in target_class.model_fields.items()
+        ]
+    elif hasattr(target_class, "__fields__"):  # Pydantic v1
+        # Handle Pydantic v1 models
+        return [(field_name, field.type_) for field_name, field in target_class.__fields__.items()]
+    return []
+
+
+def _create_setter(field_name: str, field_type: Any) -> Callable[..., Any]:
+    """Create a setter method for a field.
+
+    Args:
+        field_name: Name of the field
+        field_type: Type of the field
+
+    Returns:
+        Function to install as ``with_<field_name>`` on a builder class
+    """
+
+    def setter(self, value: Any) -> "MockBuilder[Any]":
+        """Set the value for this field."""
+        self._overrides[field_name] = value
+        return self
+
+    setter.__name__ = f"with_{field_name}"
+    setter.__annotations__ = {"value": field_type, "return": MockBuilder[Any]}
+    return setter
+
+
+# Builder subclasses specialized per target class, created on first use
+_BUILDER_CLASSES: "WeakKeyDictionary[type, type[MockBuilder[Any]]]" = WeakKeyDictionary()
+
+
+def _builder_class_for(target_class: type) -> "type[MockBuilder[Any]]":
+    """Return the builder subclass carrying ``with_*`` setters for a class.
+
+    The setters live on the class rather than being bound onto every builder
+    instance, so builders stay slotted and cheap to create.
+
+    Args:
+        target_class: The class to build mocks for
+
+    Returns:
+        MockBuilder subclass specialized for target_class
+    """
+    builder_class = _BUILDER_CLASSES.get(target_class)
+    if builder_class is None:
+        namespace: dict[str, Any] = {"__slots__": ()}
+        for field_name, field_type in _field_types(target_class):
+            namespace[f"with_{field_name}"] = _create_setter(field_name, field_type)
+        builder_class = type(f"{target_class.__name__}MockBuilder", (MockBuilder,), namespace)
+        _BUILDER_CLASSES[target_class] = builder_class
+    return builder_class
+
+
 class MockBuilder(Generic[T]):
     """Type-safe builder for generating mock data with field overrides.
 
     This builder provides IDE support and type checking for field overrides.
     """
 
+    __slots__ = ("_overrides", "_target_class")
+
+    def __new__(cls, target_class: type[T]) -> "MockBuilder[T]":
+        # Dispatch to the subclass that carries this target's with_* setters
+        if cls is MockBuilder:
+            cls = _builder_class_for(target_class)
+        return super().__new__(cls)
+
     def __init__(self, target_class: type[T]):
         """Initialize the builder for a specific class.
 
@@ -21,45 +101,6 @@ class MockBuilder(Generic[T]):
         self._target_class = target_class
         self._overrides: dict[str, Any] = {}
 
-        # Dynamically create setter methods for each field
-        self._setup_fields()
-
-    def _setup_fields(self) -> None:
-        """Set up dynamic setter methods for all fields."""
-        if is_dataclass(self._target_class):
-            # Handle dataclasses
-            for field in fields(self._target_class):
-                self._create_setter(field.name, field.type)
-        elif hasattr(self._target_class, "model_fields"):  # Pydantic v2
-            # Handle Pydantic v2 models
-            for field_name, field_info in self._target_class.model_fields.items():
-                self._create_setter(field_name, field_info.annotation)
-        elif hasattr(self._target_class, "__fields__"):  # Pydantic v1
-            # Handle Pydantic v1 models
-            for field_name, field in self._target_class.__fields__.items():
-                self._create_setter(field_name, field.type_)
-
-    def _create_setter(self, field_name: str, field_type: type) -> None:
-        """Create a setter method for a field.
-
-        Args:
-            field_name: Name of the field
-            field_type: Type of the field
-        """
-
-        def setter(self, value: Any) -> "MockBuilder[T]":
-            """Set the value for this field."""
-            self._overrides[field_name] = value
-            return self
-
-        # Create method name
-        setter_name = f"with_{field_name}"
-
-        # Set the method on the instance
-        setter.__name__ = setter_name
-        setter.__annotations__ = {"value": field_type, "return": MockBuilder[T]}
-        setattr(self, setter_name, setter.__get__(self, MockBuilder))
-
     def with_values(self, **kwargs: Any) -> "MockBuilder[T]":
         """Set multiple field values at once.
 
@@ -95,4 +136,6 @@ class MockBuilder(Generic[T]):
         Returns:
             List of mock instances
         """
-        return [self.build() for _ in range(count)]
+        from mocksmith.mock_factory import mock_many
+
+        return mock_many(self._target_class, self._overrides, count)
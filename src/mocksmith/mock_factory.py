@@ -2,9 +2,37 @@
 
 import enum
 import sys
+import uuid
 import warnings
+from collections.abc import Iterable
 from dataclasses import MISSING, fields, is_dataclass
-from typing import Any, Literal, TypeVar, Union, get_args, get_origin
+from functools import partial
+from inspect import Parameter, signature
+from itertools import repeat
+from keyword import iskeyword
+from typing import (
+    Any,
+    Callable,
+    Literal,
+    NamedTuple,
+    Optional,
+    TypeVar,
+    Union,
+    get_args,
+    get_origin,
+    get_type_hints,
+)
+from weakref import WeakKeyDictionary
+
+from mocksmith._random import (
+    add_listener,
+    draw_bools,
+    draw_floats,
+    draw_indices,
+    draw_ints,
+    get_faker,
+    get_rng,
+)
 
 try:
     from typing import Annotated
@@ -21,95 +49,228 @@ else:
 
 T = TypeVar("T")
 
-# Create a singleton Faker instance to avoid repeated instantiation
-try:
-    from faker import Faker  # pyright: ignore[reportMissingImports]
 
-    _fake = Faker()
-except ImportError:
-    _fake = None  # type: ignore[assignment]
+def _mock_uuid() -> str:
+    """Generate a random version 4 UUID string from the shared generator."""
+    return str(uuid.UUID(int=get_rng().getrandbits(128), version=4))
 
 
-def _get_faker() -> Any:
-    """Get the Faker instance, raising an error if not available."""
-    if _fake is None:
-        raise ImportError(
-            "faker library is required for mock generation. "
-            "Install with: pip install mocksmith[mock]"
-        )
-    return _fake
+# Working construction recipe per unsupported type and field-name kind (None
+# if nothing works), so the probe sequence runs once per type rather than on
+# every mock. Weakly keyed, and recipes take the type as an argument, so user
+# types are not kept alive
+_UNSUPPORTED_RECIPES: "WeakKeyDictionary[Any, dict[str, Optional[Callable[[Any], Any]]]]" = (
+    WeakKeyDictionary()
+)
 
 
-def _handle_unsupported_type(field_type: Any, field_name: str = "") -> Any:
-    """Handle unsupported types by attempting to create instances or provide defaults.
+def _field_name_kind(field_name: str) -> str:
+    """Classify a field name as naming a directory, a file, or anything else."""
+    name_lower = field_name.lower()
+    if "dir" in name_lower:
+        return "dir"
+    elif "file" in name_lower:
+        return "file"
+    return "other"
+
+
+def _probe_unsupported_type(
+    field_type: Any, kind: str
+) -> tuple[Optional[Callable[[Any], Any]], Any]:
+    """Find a way to construct an unsupported type.
 
     Args:
         field_type: The unsupported type
-        field_name: The field name (for context)
+        kind: Field-name kind from _field_name_kind
 
     Returns:
-        A mock value or None
+        Recipe taking the type and producing further mock values (None if
+        nothing worked), and the value the probe itself produced
     """
     type_name = getattr(field_type, "__name__", str(field_type))
 
     # Special handling for common types
     if type_name == "Path" or "path" in type_name.lower():
         # For pathlib.Path - try to return actual Path object
+        import tempfile
+
+        # Use tempfile to get secure temporary directory
+        temp_dir = tempfile.gettempdir()
         try:
             import pathlib
-            import tempfile
-
-            # Use tempfile to get secure temporary directory
-            temp_dir = tempfile.gettempdir()
-
-            if field_name:
-                name_lower = field_name.lower()
-                if "dir" in name_lower or "directory" in name_lower:
-                    return pathlib.Path(temp_dir) / "mock_directory"
-                elif "file" in name_lower:
-                    return pathlib.Path(temp_dir) / "mock_file.txt"
-            return pathlib.Path(temp_dir) / "mock_path"
         except ImportError:
-            import tempfile
+            mock_path = temp_dir + "/mock_path"
+            return (lambda _: mock_path), mock_path
 
-            return tempfile.gettempdir() + "/mock_path"
+        if kind == "dir":
+            path = pathlib.Path(temp_dir) / "mock_directory"
+        elif kind == "file":
+            path = pathlib.Path(temp_dir) / "mock_file.txt"
+        else:
+            path = pathlib.Path(temp_dir) / "mock_path"
+        return (lambda _: path), path
 
-    # Try to instantiate with no arguments
+    # Try to instantiate with no arguments, then None, empty string and 0
     try:
-        instance = field_type()
-        return instance
+        return _construct_without_args, field_type()
     except Exception:
         pass
+    for arg in (None, "", 0):
+        try:
+            return partial(_construct_with_arg, arg=arg), field_type(arg)
+        except Exception:
+            pass
+    return None, None
 
-    # Try to instantiate with None
-    try:
-        instance = field_type(None)
-        return instance
-    except Exception:
-        pass
 
-    # Try to instantiate with empty string
-    try:
-        instance = field_type("")
-        return instance
-    except Exception:
-        pass
+def _construct_without_args(field_type: Any) -> Any:
+    """Recipe instantiating a type with no arguments."""
+    return field_type()
 
-    # Try to instantiate with 0
-    try:
-        instance = field_type(0)
-        return instance
-    except Exception:
-        pass
 
-    # Always issue warning for unsupported types
+def _construct_with_arg(field_type: Any, arg: Any) -> Any:
+    """Recipe instantiating a type with a single argument."""
+    return field_type(arg)
+
+
+def _construct_unsupported_type(field_type: Any, kind: str) -> tuple[bool, Any]:
+    """Construct an unsupported type from its cached recipe, probing on first use.
+
+    Args:
+        field_type: The unsupported type
+        kind: Field-name kind from _field_name_kind
+
+    Returns:
+        Whether the type could be constructed, and the value (None if not)
+    """
+    try:
+        recipes = _UNSUPPORTED_RECIPES.get(field_type)
+    except TypeError:
+        # Unhashable or not weakly referenceable, so probed on every call
+        recipe, value = _probe_unsupported_type(field_type, kind)
+        return recipe is not None, value
+    if recipes is None:
+        recipes = _UNSUPPORTED_RECIPES[field_type] = {}
+    if kind not in recipes:
+        recipe, value = _probe_unsupported_type(field_type, kind)
+        recipes[kind] = recipe
+        return recipe is not None, value
+    recipe = recipes[kind]
+    if recipe is None:
+        return False, None
+    return True, recipe(field_type)
+
+
+def _warn_unsupported_type(field_type: Any, field_name: str) -> None:
+    """Warn that a field's type cannot be mocked and is left None."""
+    type_name = getattr(field_type, "__name__", str(field_type))
     warnings.warn(
         f"mocksmith: Unsupported type '{type_name}' for field '{field_name}'. "
         f"Returning None. Consider making this field Optional or providing a mock override.",
         UserWarning,
-        stacklevel=4,
+        stacklevel=7,
     )
-    return None
+
+
+def _handle_unsupported_type(field_type: Any, field_name: str = "") -> Any:
+    """Handle unsupported types by attempting to create instances or provide defaults.
+
+    Args:
+        field_type: The unsupported type
+        field_name: The field name (for context)
+
+    Returns:
+        A mock value or None
+    """
+    supported, value = _construct_unsupported_type(field_type, _field_name_kind(field_name))
+    if not supported:
+        # Always issue warning for unsupported types
+        _warn_unsupported_type(field_type, field_name)
+    return value
+
+
+def _compile_unsupported_mock(field_type: Any, field_name: str) -> Callable[[], Any]:
+    """Return a generator for an unsupported type, warning about it at most once.
+
+    Only the first mock goes through _handle_unsupported_type and may warn;
+    the state lives in the generator, so each model field warns on its own.
+
+    Args:
+        field_type: The unsupported type
+        field_name: The field name (for context)
+
+    Returns:
+        Zero-argument callable returning a mock value or None
+    """
+    kind = _field_name_kind(field_name)
+    first = True
+
+    def generate() -> Any:
+        nonlocal first
+        if first:
+            first = False
+            return _handle_unsupported_type(field_type, field_name)
+        return _construct_unsupported_type(field_type, kind)[1]
+
+    return generate
+
+
+def _mock_ip_any(fake: Any) -> str:
+    """Generate an IPv4 (80%) or IPv6 address."""
+    return fake.ipv4() if fake.boolean(chance_of_getting_true=80) else fake.ipv6()
+
+
+def _mock_ip_any_network(fake: Any) -> str:
+    """Generate an IPv4 (80%) or IPv6 network in CIDR notation."""
+    if fake.boolean(chance_of_getting_true=80):
+        return f"{fake.ipv4()}/24"
+    return f"{fake.ipv6()}/64"
+
+
+def _mock_ip_any_interface(fake: Any) -> str:
+    """Generate an IPv4 (80%) or IPv6 interface in CIDR notation."""
+    ip = _mock_ip_any(fake)
+    prefix = "/24" if "." in ip else "/64"
+    return f"{ip}{prefix}"
+
+
+# Generators for Pydantic built-in types, keyed by type name
+_PYDANTIC_NAMED_MOCKS: dict[str, Callable[[Any], Any]] = {
+    # Network types
+    "HttpUrl": lambda fake: fake.url(),
+    "AnyHttpUrl": lambda fake: fake.url(),
+    "EmailStr": lambda fake: fake.email(),
+    "IPvAnyAddress": _mock_ip_any,
+    "IPvAnyInterface": _mock_ip_any_interface,
+    "IPvAnyNetwork": _mock_ip_any_network,
+    "IPv4Address": lambda fake: fake.ipv4(),
+    "IPv4Interface": lambda fake: f"{fake.ipv4()}/24",
+    "IPv4Network": lambda fake: f"{fake.ipv4()}/24",
+    "IPv6Address": lambda fake: fake.ipv6(),
+    "IPv6Interface": lambda fake: f"{fake.ipv6()}/64",
+    "IPv6Network": lambda fake: f"{fake.ipv6()}/64",
+    # Numeric types
+    "PositiveInt": lambda fake: fake.random_int(min=1, max=10000),
+    "NegativeInt": lambda fake: fake.random_int(min=-10000, max=-1),
+    "NonNegativeInt": lambda fake: fake.random_int(min=0, max=10000),
+    "NonPositiveInt": lambda fake: fake.random_int(min=-10000, max=0),
+    "PositiveFloat": lambda fake: fake.pyfloat(min_value=0.01, max_value=10000),
+    "NegativeFloat": lambda fake: fake.pyfloat(min_value=-10000, max_value=-0.01),
+    "NonNegativeFloat": lambda fake: fake.pyfloat(min_value=0, max_value=10000),
+    "NonPositiveFloat": lambda fake: fake.pyfloat(min_value=-10000, max_value=0),
+    # String types (a random v4 UUID stands in for every UUID version)
+    "UUID1": lambda fake: _mock_uuid(),
+    "UUID3": lambda fake: _mock_uuid(),
+    "UUID4": lambda fake: _mock_uuid(),
+    "UUID5": lambda fake: _mock_uuid(),
+    "SecretStr": lambda fake: fake.password(),
+    "Json": lambda fake: fake.json(),
+    # Date/time types
+    "FutureDate": lambda fake: fake.future_date(),
+    "PastDate": lambda fake: fake.past_date(),
+    "FutureDatetime": lambda fake: fake.future_datetime(),
+    "PastDatetime": lambda fake: fake.past_datetime(),
+}
 
 
 def _generate_pydantic_type_mock(field_type: Any, field_name: str = "") -> Any:
@@ -122,88 +283,18 @@ def _generate_pydantic_type_mock(field_type: Any, field_name: str = "") -> Any:
     Returns:
         Mock value appropriate for the Pydantic type
     """
-    fake = _get_faker()
+    fake = get_faker()
     from decimal import Decimal
 
     type_name = field_type.__name__ if hasattr(field_type, "__name__") else str(field_type)
 
-    # Network types
-    if type_name == "HttpUrl":
-        return fake.url()
-    elif type_name == "AnyHttpUrl":
-        return fake.url()
-    elif type_name == "EmailStr":
-        return fake.email()
-    elif type_name == "IPvAnyAddress":
-        return fake.ipv4() if fake.boolean(chance_of_getting_true=80) else fake.ipv6()
-    elif type_name == "IPvAnyInterface":
-        ip = fake.ipv4() if fake.boolean(chance_of_getting_true=80) else fake.ipv6()
-        prefix = "/24" if "." in ip else "/64"
-        return f"{ip}{prefix}"
-    elif type_name == "IPvAnyNetwork":
-        if fake.boolean(chance_of_getting_true=80):
-            return f"{fake.ipv4()}/24"
-        else:
-            return f"{fake.ipv6()}/64"
-    elif type_name in ["IPv4Address", "IPv4Interface", "IPv4Network"]:
-        if type_name == "IPv4Address":
-            return fake.ipv4()
-        elif type_name == "IPv4Interface":
-            return f"{fake.ipv4()}/24"
-        else:  # IPv4Network
-            return f"{fake.ipv4()}/24"
-    elif type_name in ["IPv6Address", "IPv6Interface", "IPv6Network"]:
-        if type_name == "IPv6Address":
-            return fake.ipv6()
-        elif type_name == "IPv6Interface":
-            return f"{fake.ipv6()}/64"
-        else:  # IPv6Network
-            return f"{fake.ipv6()}/64"
-
-    # Numeric types
-    elif type_name == "PositiveInt":
-        return fake.random_int(min=1, max=10000)
-    elif type_name == "NegativeInt":
-        return fake.random_int(min=-10000, max=-1)
-    elif type_name == "NonNegativeInt":
-        return fake.random_int(min=0, max=10000)
-    elif type_name == "NonPositiveInt":
-        return fake.random_int(min=-10000, max=0)
-    elif type_name == "PositiveFloat":
-        return fake.pyfloat(min_value=0.01, max_value=10000)
-    elif type_name == "NegativeFloat":
-        return fake.pyfloat(min_value=-10000, max_value=-0.01)
-    elif type_name == "NonNegativeFloat":
-        return fake.pyfloat(min_value=0, max_value=10000)
-    elif type_name == "NonPositiveFloat":
-        return fake.pyfloat(min_value=-10000, max_value=0)
-
-    # String types
-    elif type_name == "UUID1":
-        return str(fake.uuid4())  # Using uuid4 as faker doesn't have uuid1
-    elif type_name == "UUID3":
-        return str(fake.uuid4())  # Using uuid4 as faker doesn't have uuid3
-    elif type_name == "UUID4":
-        return str(fake.uuid4())
-    elif type_name == "UUID5":
-        return str(fake.uuid4())  # Using uuid4 as faker doesn't have uuid5
-    elif type_name == "SecretStr":
-        return fake.password()
-    elif type_name == "Json":
-        return fake.json()
-
-    # Date/time types
-    elif type_name == "FutureDate":
-        return fake.future_date()
-    elif type_name == "PastDate":
-        return fake.past_date()
-    elif type_name == "FutureDatetime":
-        return fake.future_datetime()
-    elif type_name == "PastDatetime":
-        return fake.past_datetime()
+    # Named Pydantic types resolve with a single lookup instead of a name scan
+    generator = _PYDANTIC_NAMED_MOCKS.get(type_name)
+    if generator is not None:
+        return generator(fake)
 
     # For constrained types (constr, conint, etc.)
-    elif hasattr(field_type, "__supertype__"):
+    if hasattr(field_type, "__supertype__"):
         base_type = field_type.__supertype__
         if base_type is str:
             # Handle constr
@@ -305,17 +396,20 @@ def _generate_pydantic_type_mock(field_type: Any, field_name: str = "") -> Any:
     return None
 
 
-def _generate_pydantic_annotated_mock(field_type: Any, field_name: str = "") -> Any:
-    """Generate mock data for Pydantic v2 Annotated types.
+def _compile_pydantic_annotated_mock(field_type: Any, field_name: str = "") -> Callable[[], Any]:
+    """Resolve a Pydantic v2 Annotated type's constraints into a generator.
+
+    The metadata is read once here; the returned callable only generates
+    values.
 
     Args:
         field_type: The Annotated type with Pydantic constraints
         field_name: The field name (for context)
 
     Returns:
-        Mock value that satisfies the constraints
+        Zero-argument callable returning values that satisfy the constraints
     """
-    fake = _get_faker()
+    fake = get_faker()
     from decimal import Decimal
 
     # Get the base type and metadata
@@ -325,14 +419,14 @@ def _generate_pydantic_annotated_mock(field_type: Any, field_name: str = "") ->
         if hasattr(field_type, "__args__"):
             args = field_type.__args__
         else:
-            return None
+            return lambda: None
 
     base_type = args[0]
     metadata = getattr(field_type, "__metadata__", ())
 
     # Handle UUID types
     if base_type.__name__ == "UUID":
-        return str(fake.uuid4())
+        return _mock_uuid
 
     # Handle numeric constraints
     if base_type in (int, float, Decimal):
@@ -417,43 +511,43 @@ def _generate_pydantic_annotated_mock(field_type: Any, field_name: str = "") ->
                 max_val = float(min_val) + 0.01
 
         if base_type is int:
-            return fake.random_int(min=int(min_val), max=int(max_val))
+            return partial(fake.random_int, min=int(min_val), max=int(max_val))
         elif base_type is Decimal:
             # Generate decimal with constraints
             if decimal_places is not None:
                 # Generate a float and round to decimal places
-                float_val = fake.pyfloat(
-                    min_value=float(min_val) if min_val is not None else -10000.0,
-                    max_value=float(max_val) if max_val is not None else 10000.0,
+                pyfloat = partial(
+                    fake.pyfloat,
+                    min_value=float(min_val),
+                    max_value=float(max_val),
                     right_digits=decimal_places,
                 )
                 # Round to the correct number of decimal places
                 quantizer = Decimal("0.1") ** decimal_places
-                dec_val = Decimal(str(float_val)).quantize(quantizer)
 
-                # Ensure we respect max_digits constraint
+                # Calculate max allowed integer digits for the max_digits constraint
+                max_integer_value = None
                 if max_digits is not None:
-                    # Calculate max allowed integer digits
-                    integer_digits = max_digits - (decimal_places or 0)
-                    max_integer_value = 10**integer_digits - 1
+                    max_integer_value = 10 ** (max_digits - decimal_places) - 1
+
+                def constrained_decimal() -> Decimal:
+                    dec_val = Decimal(str(pyfloat())).quantize(quantizer)
 
                     # Clamp the value to respect max_digits
-                    if abs(dec_val) > max_integer_value:
+                    if max_integer_value is not None and abs(dec_val) > max_integer_value:
                         if dec_val > 0:
                             dec_val = Decimal(str(max_integer_value))
                         else:
                             dec_val = Decimal(str(-max_integer_value))
+                    return dec_val
 
-                return dec_val
+                return constrained_decimal
             else:
                 # No decimal places specified, generate as float and convert
-                float_val = fake.pyfloat(
-                    min_value=float(min_val) if min_val is not None else -10000.0,
-                    max_value=float(max_val) if max_val is not None else 10000.0,
-                )
-                return Decimal(str(float_val))
+                pyfloat = partial(fake.pyfloat, min_value=float(min_val), max_value=float(max_val))
+                return lambda: Decimal(str(pyfloat()))
         else:
-            return fake.pyfloat(min_value=float(min_val), max_value=float(max_val))
+            return partial(fake.pyfloat, min_value=float(min_val), max_value=float(max_val))
 
     # Handle string constraints
     elif base_type is str:
@@ -483,11 +577,16 @@ def _generate_pydantic_annotated_mock(field_type: Any, field_name: str = "") ->
             # Handle some common patterns
             if pattern == r"^[A-Z]{3}[0-9]{3}$":
                 # Generate 3 uppercase letters + 3 digits
-                letters = "".join(
-                    fake.random_element("ABCDEFGHIJKLMNOPQRSTUVWXYZ") for _ in range(3)
-                )
-                digits = "".join(fake.random_element("0123456789") for _ in range(3))
-                return letters + digits
+                random_element = fake.random_element
+
+                def letters_and_digits() -> str:
+                    letters = "".join(
+                        random_element("ABCDEFGHIJKLMNOPQRSTUVWXYZ") for _ in range(3)
+                    )
+                    digits = "".join(random_element("0123456789") for _ in range(3))
+                    return letters + digits
+
+                return letters_and_digits
             # For other patterns, fall back to basic string generation
             # TODO: Add more pattern support or use a regex generator
 
@@ -496,10 +595,10 @@ def _generate_pydantic_annotated_mock(field_type: Any, field_name: str = "") ->
         if max_length is None:
             max_length = 50
 
-        return fake.pystr(min_chars=min_length, max_chars=max_length)
+        return partial(fake.pystr, min_chars=min_length, max_chars=max_length)
 
     # Fall back to basic type generation
-    return _generate_field_mock(base_type, field_name)
+    return _compile_field_mock(base_type, field_name)
 
 
 def mock_factory(cls: type[T], **overrides: Any) -> T:
@@ -512,292 +611,743 @@ def mock_factory(cls: type[T], **overrides: Any) -> T:
     Returns:
         Mock instance with all fields populated
 
+    Raises:
+        TypeError: If the class type is not supported
+    """
+    return _get_model_plan(cls)[1](cls, overrides)
+
+
+def mock_many(cls: type[T], overrides: dict[str, Any], count: int) -> list[T]:
+    """Generate several mock instances of a class, column by column.
+
+    Fields whose values can be drawn in bulk (Literal, Enum, bool, int, float
+    and Optionals of those) fill their whole column with one batched draw;
+    other fields call their generator once per row.
+
+    Args:
+        cls: The class to generate mocks for
+        overrides: Field values shared by every instance
+        count: Number of instances to build
+
+    Returns:
+        List of mock instances
+
+    Raises:
+        TypeError: If the class type is not supported
+    """
+    plan = _get_model_plan(cls)[0]
+    if not plan:
+        return [cls() for _ in range(count)]
+
+    columns: list[Iterable[Any]] = []
+    for field in plan:
+        if field.name in overrides:
+            columns.append(repeat(overrides[field.name], count))
+        elif field.batch is not None:
+            columns.append(field.batch(count))
+        else:
+            generate = field.generate
+            columns.append([generate() for _ in range(count)])
+
+    return list(map(_compile_row_constructor(cls, plan, overrides), *columns))
+
+
+def _get_plan_builder(cls: type) -> Callable[[type], tuple["_FieldPlan", ...]]:
+    """Resolve the field plan builder for a class.
+
+    Args:
+        cls: The class to generate mocks for
+
+    Returns:
+        Function building the class's field plan
+
     Raises:
         TypeError: If the class type is not supported
     """
     if is_dataclass(cls):
-        return _mock_dataclass(cls, overrides)
+        return _plan_dataclass
     elif hasattr(cls, "model_fields"):  # Pydantic v2
-        return _mock_pydantic_model(cls, overrides)
+        return _plan_pydantic_model
     elif hasattr(cls, "__fields__"):  # Pydantic v1
-        return _mock_pydantic_model_v1(cls, overrides)
+        return _plan_pydantic_model_v1
     else:
         raise TypeError(f"mock_factory only supports dataclasses and Pydantic models, got {cls}")
 
 
-def _mock_dataclass(cls: type[T], overrides: dict[str, Any]) -> T:
-    """Generate mock for a dataclass."""
-    mock_data = {}
+class _FieldPlan(NamedTuple):
+    """How to generate mock values for one model field."""
 
-    for field in fields(cls):
-        # Use override if provided
-        if field.name in overrides:
-            mock_data[field.name] = overrides[field.name]
-            continue
-
-        # Check if field.type is Annotated and has a mock provider in metadata
-        mock_value = None
-        origin = get_origin(field.type)
-        if origin is Annotated:
-            # Get metadata from the Annotated type
-            metadata = getattr(field.type, "__metadata__", ())
-            for metadata_item in metadata:
-                # Handle mock providers with mock() method (duck typing)
-                if hasattr(metadata_item, "mock") and callable(metadata_item.mock):
-                    mock_value = metadata_item.mock()
-                    break
-
-        # If no mock provider found, use regular generation
-        if mock_value is None:
-            mock_value = _generate_field_mock(field.type, field.name)
+    name: str
+    # Produces the field's mock value
+    generate: Callable[[], Any]
+    # Used when the mock value is None, unless MISSING
+    default: Any
+    # For plain Optional[T] fields, produces the non-None value so compiled
+    # constructors can batch the None coin flips
+    optional: Optional[Callable[[], Any]]
+    # Produces a list of n values in one batched draw, for types that support it
+    batch: Optional[Callable[[int], list[Any]]]
+
+
+# Optional fields are None when a random byte falls below this (51/256 ~ 20%)
+_OPTIONAL_NONE_THRESHOLD = 51
+
+# Field plans per model class with a mock function (taking the class and the
+# overrides) compiled from them, built on first mock and reused afterwards.
+# Values never reference their class, so entries die with it
+_ModelPlan = tuple[tuple[_FieldPlan, ...], Callable[[Any, dict[str, Any]], Any]]
+_MODEL_PLANS: "WeakKeyDictionary[type, _ModelPlan]" = WeakKeyDictionary()
+
+# Compiled generators bind the shared generator's methods, so plans are rebuilt
+# when it is replaced
+_plans_rng: Any = None
+
+
+def _reset_model_plans(rng: Any) -> None:
+    """Drop cached plans if the shared generator was replaced."""
+    global _plans_rng
+    if rng is not _plans_rng:
+        _MODEL_PLANS.clear()
+        _plans_rng = rng
+
+
+add_listener(_reset_model_plans)
+
+# Constructor factories compiled from generated source, shared by every model
+# whose plan produces the same source
+_CONSTRUCTOR_FACTORIES: dict[str, Callable[..., Callable[[], Any]]] = {}
+
+
+def _find_mock_provider(metadata: Any) -> Any:
+    """Return the first metadata item with a callable mock() method, if any."""
+    for metadata_item in metadata:
+        # Handle mock providers with mock() method (duck typing)
+        if hasattr(metadata_item, "mock") and callable(metadata_item.mock):
+            return metadata_item
+    return None
+
+
+def _or_else(primary: Callable[[], Any], fallback: Callable[[], Any]) -> Callable[[], Any]:
+    """Combine two generators, using fallback when primary produces None."""
+
+    def generate() -> Any:
+        value = primary()
+        return fallback() if value is None else value
+
+    return generate
+
+
+def _compile_constructor(cls: type[T], plan: tuple[_FieldPlan, ...]) -> Callable[[type[T]], T]:
+    """Generate a function building a mock instance without overrides.
+
+    The function calls each field generator inline as a keyword argument, e.g.
+    ``_cls(name=_g0(), tag=_v if (_v := _g1()) is not None else _d1)``, so no
+    per-call dict is built or unpacked. Dataclasses whose constructor takes
+    exactly the plan's fields, in order, get positional arguments instead, so
+    the source depends only on the plan's shape and one compiled factory
+    serves every class with it.
+
+    Args:
+        cls: The class to construct
+        plan: Field plan for the class
+
+    Returns:
+        Callable taking the class and returning a mock instance; the class is
+        an argument so the cached constructor does not keep it alive
+    """
+    positional = _takes_fields_positionally(cls, plan)
+    if not positional and not _plan_has_identifier_names(plan):
+        return partial(_mock_from_plan, plan=plan, overrides={})
+
+    params = ["_getrandbits"]
+    values: list[Any] = [get_rng().getrandbits]
+    kwargs = []
+    optionals = 0
+    for i, (name, generate, default, optional, _) in enumerate(plan):
+        params.append(f"_g{i}")
+        if default is MISSING:
+            value, fallback = f"_g{i}()", "None"
+        else:
+            params.append(f"_d{i}")
+            value = f"_v if (_v := _g{i}()) is not None else _d{i}"
+            fallback = f"_d{i}"
+        if optional is None:
+            values.append(generate)
+        else:
+            # One random byte from a shared draw decides None vs a value
+            values.append(optional)
+            byte = f"(_bits >> {8 * optionals}) & 255" if optionals else "_bits & 255"
+            value = f"({value}) if {byte} >= {_OPTIONAL_NONE_THRESHOLD} else {fallback}"
+            optionals += 1
+        if default is not MISSING:
+            values.append(default)
+        kwargs.append(value if positional else f"{name}={value}")
+
+    draw = f"        _bits = _getrandbits({8 * optionals})\n" if optionals else ""
+    return _compile_function(
+        params, ["_cls"], draw + f"        return _cls({', '.join(kwargs)})\n"
+    )(*values)
+
+
+def _compile_row_constructor(
+    cls: type[T], plan: tuple[_FieldPlan, ...], overrides: dict[str, Any]
+) -> Callable[..., T]:
+    """Generate a function building an instance from one value per plan field.
+
+    Non-overridden fields with a default fall back to it when their value is
+    None, matching the single-mock path.
+
+    Args:
+        cls: The class to construct
+        plan: Field plan for the class
+        overrides: Overridden fields, passed through even when None
+
+    Returns:
+        Callable taking the field values positionally and returning an instance
+    """
+    if not _plan_has_identifier_names(plan):
+
+        def construct_row(*row: Any) -> T:
+            return cls(
+                **{
+                    field.name: value
+                    for field, value in zip(plan, row)
+                    if value is not None or field.default is MISSING or field.name in overrides
+                }
+            )
+
+        return construct_row
+
+    params = ["_cls"]
+    values: list[Any] = [cls]
+    args = []
+    kwargs = []
+    for i, field in enumerate(plan):
+        args.append(f"v{i}")
+        if field.default is MISSING or field.name in overrides:
+            kwargs.append(f"{field.name}=v{i}")
+        else:
+            params.append(f"_d{i}")
+            values.append(field.default)
+            kwargs.append(f"{field.name}=v{i} if v{i} is not None else _d{i}")
+
+    return _compile_function(params, args, f"        return _cls({', '.join(kwargs)})\n")(*values)
+
+
+def _takes_fields_positionally(cls: type, plan: tuple[_FieldPlan, ...]) -> bool:
+    """Check whether a dataclass's constructor takes exactly the plan's fields positionally.
+
+    The constructor's own signature is compared, since a custom __init__ or
+    InitVar pseudo-fields can take parameters in another order than fields().
+    """
+    if not is_dataclass(cls):
+        return False
+    try:
+        parameters = signature(cls).parameters.values()
+    except (TypeError, ValueError):
+        return False
+    return [parameter.name for parameter in parameters] == [field.name for field in plan] and all(
+        parameter.kind is Parameter.POSITIONAL_OR_KEYWORD for parameter in parameters
+    )
+
+
+def _plan_has_identifier_names(plan: tuple[_FieldPlan, ...]) -> bool:
+    """Check that every field name can appear as a keyword in generated source."""
+    return all(field.name.isidentifier() and not iskeyword(field.name) for field in plan)
+
+
+def _compile_function(params: list[str], args: list[str], body: str) -> Callable[..., Any]:
+    """Compile a factory returning ``def construct(*args): <body>`` closed over params.
+
+    Factories are cached by source text, so every model whose plan produces
+    the same source shares one.
+    """
+    source = (
+        f"def _make({', '.join(params)}):\n"
+        f"    def construct({', '.join(args)}):\n"
+        f"{body}"
+        f"    return construct\n"
+    )
+    make = _CONSTRUCTOR_FACTORIES.get(source)
+    if make is None:
+        namespace: dict[str, Any] = {}
+        # Safe: the source only interpolates names checked to be identifiers
+        exec(source, namespace)
+        make = _CONSTRUCTOR_FACTORIES[source] = namespace["_make"]
+    return make
+
+
+def _get_model_plan(
+    cls: type[T],
+) -> tuple[tuple[_FieldPlan, ...], Callable[[type[T], dict[str, Any]], T]]:
+    """Return the class's field plan and mock function, building them on first use.
+
+    Raises:
+        TypeError: If the class type is not supported
+    """
+    entry = _MODEL_PLANS.get(cls)
+    if entry is None:
+        plan = _get_plan_builder(cls)(cls)
+        construct = _compile_constructor(cls, plan)
+
+        def mock(cls: type[T], overrides: dict[str, Any]) -> T:
+            if overrides:
+                return _mock_from_plan(cls, plan, overrides)
+            return construct(cls)
+
+        entry = _MODEL_PLANS[cls] = (plan, mock)
+    return entry
+
+
+# Cleared kwargs dicts reused by _mock_from_plan; nested mocks each take their
+# own, so a pool rather than a single dict
+_SCRATCH_KWARGS: list[dict[str, Any]] = []
+
+
+def _mock_from_plan(cls: type[T], plan: tuple[_FieldPlan, ...], overrides: dict[str, Any]) -> T:
+    """Instantiate a class with mock values generated from its field plan."""
+    mock_data = _SCRATCH_KWARGS.pop() if _SCRATCH_KWARGS else {}
+    try:
+        for name, generate, default, _, _ in plan:
+            # Use override if provided
+            if name in overrides:
+                mock_data[name] = overrides[name]
+                continue
+
+            mock_value = generate()
 
-        # Only include the field if it's required or has a non-None value
-        if field.default is not MISSING and mock_value is None:
             # Field has a default and mock returned None, skip it
-            continue
+            if mock_value is None and default is not MISSING:
+                continue
 
-        mock_data[field.name] = mock_value
+            mock_data[name] = mock_value
 
-    return cls(**mock_data)
+        # The call copies the keyword arguments, so the dict can be reused
+        return cls(**mock_data)
+    finally:
+        mock_data.clear()
+        _SCRATCH_KWARGS.append(mock_data)
 
 
-def _mock_pydantic_model(cls: type[T], overrides: dict[str, Any]) -> T:
-    """Generate mock for a Pydantic v2 model."""
-    mock_data = {}
+def _resolve_string_annotations(cls: type) -> dict[str, Any]:
+    """Resolve string annotations (e.g. under ``from __future__ import annotations``).
 
-    for field_name, field_info in cls.model_fields.items():
-        # Use override if provided
-        if field_name in overrides:
-            mock_data[field_name] = overrides[field_name]
-            continue
-
-        # Check for mock provider in metadata first
-        mock_value = None
-        if hasattr(field_info, "metadata"):
-            for metadata_item in field_info.metadata:
-                # Handle mock providers with mock() method (duck typing)
-                if hasattr(metadata_item, "mock") and callable(metadata_item.mock):
-                    mock_value = metadata_item.mock()
-                    break
-
-        # If no mock provider found in metadata, check for Pydantic constraints
-        if mock_value is None:
-            # Check if field has Pydantic constraint metadata
-            if hasattr(field_info, "metadata") and field_info.metadata:
-                # Check for Pydantic-specific metadata
-                has_pydantic_metadata = False
-                for m in field_info.metadata:
-                    if m is not None and hasattr(m, "__module__"):
-                        module = getattr(m, "__module__", "")
-                        if "pydantic" in module or "annotated_types" in module:
-                            has_pydantic_metadata = True
-                            break
-                    # Also check for specific constraint types
-                    if hasattr(m, "__class__") and m.__class__.__name__ in [
-                        "Interval",
-                        "Lt",
-                        "Le",
-                        "Gt",
-                        "Ge",
-                        "StringConstraints",
-                    ]:
-                        has_pydantic_metadata = True
-                        break
-
-                if has_pydantic_metadata:
-                    # Create a mock Annotated type for the handler
-                    class MockAnnotated:
-                        __metadata__ = field_info.metadata
-                        __origin__ = Annotated
-
-                    # Add the args
-                    MockAnnotated.__args__ = (field_info.annotation, *field_info.metadata)
-
-                    # Try to generate with Pydantic annotated handler
-                    pydantic_mock = _generate_pydantic_annotated_mock(MockAnnotated, field_name)
-                    if pydantic_mock is not None:
-                        mock_value = pydantic_mock
-
-            # If still no mock value, use standard generation
-            if mock_value is None:
-                field_type = field_info.annotation
-                mock_value = _generate_field_mock(field_type, field_name)
-
-        mock_data[field_name] = mock_value
-
-    return cls(**mock_data)
-
-
-def _mock_pydantic_model_v1(cls: type[T], overrides: dict[str, Any]) -> T:
-    """Generate mock for a Pydantic v1 model."""
-    mock_data = {}
-
-    for field_name, field in cls.__fields__.items():
-        # Use override if provided
-        if field_name in overrides:
-            mock_data[field_name] = overrides[field_name]
-            continue
-
-        # Get the field type
-        field_type = field.type_
-        mock_data[field_name] = _generate_field_mock(field_type, field_name)
-
-    return cls(**mock_data)
-
-
-def _generate_field_mock(field_type: Any, field_name: str = "", _depth: int = 0) -> Any:
-    """Generate mock value for a field based on its type.
+    ``get_type_hints`` is slow, so it only runs when a dataclass field's type
+    is a string; the result is captured in the class's cached plan.
 
     Args:
-        field_type: The type annotation of the field
-        field_name: The name of the field (used for smart generation)
-        _depth: Recursion depth for nested types
+        cls: The dataclass to inspect
 
     Returns:
-        Mock value appropriate for the field type
+        Resolved hints by field name, or an empty dict if none are needed or
+        they cannot be resolved
     """
-    # Get origin for type checking
-    origin = get_origin(field_type)
+    if not any(isinstance(field.type, str) for field in fields(cls)):
+        return {}
+    try:
+        return get_type_hints(cls, include_extras=True)
+    except Exception:
+        # Unresolvable forward references keep their raw string annotation
+        return {}
 
-    # Handle Optional types (Union with None) FIRST
+
+def _plan_dataclass(cls: type) -> tuple[_FieldPlan, ...]:
+    """Build the field plan for a dataclass."""
+    hints = _resolve_string_annotations(cls)
+    plan = []
+    for field in fields(cls):
+        field_type = hints.get(field.name, field.type)
+        generate, optional, batch = _compile_plan_field(field_type, field.name)
+
+        # Check if the type is Annotated and has a mock provider in metadata
+        if get_origin(field_type) is Annotated:
+            provider = _find_mock_provider(getattr(field_type, "__metadata__", ()))
+            if provider is not None:
+                generate, optional, batch = _or_else(provider.mock, generate), None, None
+
+        # Only include the field if it's required or has a non-None value
+        plan.append(_FieldPlan(field.name, generate, field.default, optional, batch))
+    return tuple(plan)
+
+
+def _has_pydantic_metadata(metadata: Any) -> bool:
+    """Check whether field metadata carries Pydantic constraints."""
+    for m in metadata:
+        if m is not None and hasattr(m, "__module__"):
+            module = getattr(m, "__module__", "")
+            if "pydantic" in module or "annotated_types" in module:
+                return True
+        # Also check for specific constraint types
+        if hasattr(m, "__class__") and m.__class__.__name__ in [
+            "Interval",
+            "Lt",
+            "Le",
+            "Gt",
+            "Ge",
+            "StringConstraints",
+        ]:
+            return True
+    return False
+
+
+def _plan_pydantic_model(cls: type) -> tuple[_FieldPlan, ...]:
+    """Build the field plan for a Pydantic v2 model."""
+    plan = []
+    for field_name, field_info in cls.model_fields.items():
+        metadata = getattr(field_info, "metadata", None) or ()
+        generate, optional, batch = _compile_plan_field(field_info.annotation, field_name)
+
+        # Pydantic constraints are handled through an Annotated stand-in
+        if _has_pydantic_metadata(metadata):
+
+            class MockAnnotated:
+                __metadata__ = metadata
+                __origin__ = Annotated
+                __args__ = (field_info.annotation, *metadata)
+
+            constrained = _compile_pydantic_annotated_mock(MockAnnotated, field_name)
+            generate, optional, batch = _or_else(constrained, generate), None, None
+
+        # Mock providers in metadata take precedence over both
+        provider = _find_mock_provider(metadata)
+        if provider is not None:
+            generate, optional, batch = _or_else(provider.mock, generate), None, None
+
+        plan.append(_FieldPlan(field_name, generate, MISSING, optional, batch))
+    return tuple(plan)
+
+
+def _plan_pydantic_model_v1(cls: type) -> tuple[_FieldPlan, ...]:
+    """Build the field plan for a Pydantic v1 model."""
+    plan = []
+    for name, field in cls.__fields__.items():
+        generate, optional, batch = _compile_plan_field(field.type_, name)
+        plan.append(_FieldPlan(name, generate, MISSING, optional, batch))
+    return tuple(plan)
+
+
+def _unique_items(generate: Callable[[], Any], count: int) -> list[Any]:
+    """Generate up to count distinct items, giving up after count * 3 attempts."""
+    items: list[Any] = []
+    attempts = 0
+    while len(items) < count and attempts < count * 3:
+        item = generate()
+        if item not in items:
+            items.append(item)
+        attempts += 1
+    return items
+
+
+def _optional_inner_type(field_type: Any) -> Any:
+    """Return T for Optional[T] (or T | None), and None for any other type."""
     # Check both typing.Union and Python 3.10+ pipe syntax (types.UnionType)
+    origin = get_origin(field_type)
     is_union = origin is Union or (UnionType is not None and isinstance(field_type, UnionType))
     if is_union:
         args = get_args(field_type)
         if type(None) in args:
-            # It's an Optional type
-            inner_type = next(arg for arg in args if arg is not type(None))
-            # For optional fields, sometimes return None
-            if _get_faker().boolean(chance_of_getting_true=80):  # 80% chance of having a value
-                return _generate_field_mock(inner_type, field_name, _depth + 1)
+            return next(arg for arg in args if arg is not type(None))
+    return None
+
+
+def _optional_generator(inner: Callable[[], Any]) -> Callable[[], Any]:
+    """Wrap a generator to produce None for optional fields ~20% of the time."""
+    random_ = get_rng().random
+
+    def optional() -> Any:
+        return inner() if random_() < 0.8 else None
+
+    return optional
+
+
+def _optional_batch(
+    inner: Callable[[], Any], inner_batch: Optional[Callable[[int], list[Any]]]
+) -> Callable[[int], list[Any]]:
+    """Wrap a generator to produce n values at once, ~20% of them None."""
+
+    def batch(count: int) -> list[Any]:
+        keep = draw_bools(0.8, count)
+        if inner_batch is None:
+            return [inner() if kept else None for kept in keep]
+        values = iter(inner_batch(sum(keep)))
+        return [next(values) if kept else None for kept in keep]
+
+    return batch
+
+
+def _choice_batch(choices: tuple[Any, ...], count: int) -> list[Any]:
+    """Pick count values uniformly from choices in one batched draw."""
+    return [choices[i] for i in draw_indices(len(choices), count)]
+
+
+def _float_batch(count: int) -> list[float]:
+    """Draw count floats in [0, 100), matching the scalar float mock."""
+    return [value * 100 for value in draw_floats(count)]
+
+
+def _compile_field_batch(field_type: Any) -> Optional[Callable[[int], list[Any]]]:
+    """Return a generator of n values at once for types drawable in bulk, else None.
+
+    The distributions match the scalar generators from _compile_field_mock.
+    """
+    choices = _choices_for(field_type)
+    if choices is None:
+        if field_type is bool:
+            choices = (True, False)
+        elif field_type is int:
+            # Same range as Faker's random_int()
+            return partial(draw_ints, 0, 9999)
+        elif field_type is float:
+            return _float_batch
+        elif callable(getattr(field_type, "mock_many", None)):
+            # Custom types that can draw many values at once
+            return field_type.mock_many
+        else:
             return None
+    return partial(_choice_batch, choices) if choices else None
+
+
+def _compile_plan_field(
+    field_type: Any, field_name: str
+) -> tuple[Callable[[], Any], Optional[Callable[[], Any]], Optional[Callable[[int], list[Any]]]]:
+    """Compile a model field into its generator, Optional inner generator and batch generator."""
+    inner_type = _optional_inner_type(field_type)
+    if inner_type is None:
+        return _compile_field_mock(field_type, field_name), None, _compile_field_batch(field_type)
+    choices = _choices_for(inner_type)
+    if choices is not None:
+        # The None decision folds into the value pick, leaving no separate draw
+        choices = _optional_choices(choices)
+        return _choice_generator(choices), None, partial(_choice_batch, choices)
+    inner = _compile_field_mock(inner_type, field_name, 1)
+    batch = _optional_batch(inner, _compile_field_batch(inner_type))
+    return _optional_generator(inner), inner, batch
+
 
-    # Handle Enum types
+# Value tuples of Enum classes and Literal annotations, shared by every plan
+# field with the same annotation
+_CHOICES: dict[Any, tuple[Any, ...]] = {}
+
+
+def _choices_for(field_type: Any) -> Optional[tuple[Any, ...]]:
+    """Return the values of an Enum or Literal type, or None for other types."""
+    try:
+        return _CHOICES[field_type]
+    except (KeyError, TypeError):
+        pass
     if isinstance(field_type, type) and issubclass(field_type, enum.Enum):
-        # Get all enum values and pick one randomly
-        enum_values = list(field_type)
-        return _get_faker().random_element(enum_values)
+        choices = tuple(field_type)
+    elif get_origin(field_type) is Literal:
+        choices = get_args(field_type)
+    else:
+        return None
+    _CHOICES[field_type] = choices
+    return choices
+
+
+def _optional_choices(choices: tuple[Any, ...]) -> tuple[Any, ...]:
+    """Return choices for Optional[Enum/Literal]: each value 4 times, then as many Nones.
+
+    Picking uniformly from the result gives None the usual 20% of the time
+    with a single draw.
+    """
+    return choices * 4 + (None,) * len(choices)
+
+
+def _choice_generator(choices: tuple[Any, ...]) -> Callable[[], Any]:
+    """Return a generator picking uniformly from a fixed tuple of choices.
+
+    Single-choice tuples need no random draw and two choices (including
+    ``Literal[True, False]``) need a single random bit, so those get dedicated
+    closures.
+    """
+    if len(choices) == 1:
+        (only,) = choices
+        return lambda: only
+
+    if len(choices) == 2:
+        getrandbits = get_rng().getrandbits
+        first, second = choices
+        return lambda: first if getrandbits(1) else second
+
+    random_ = get_rng().random
+
+    # Same index computation as random.choices, without its per-call setup
+    count = len(choices)
+    return lambda: choices[int(random_() * count)]
+
+
+def _list_generator(
+    field_type: Any, field_name: str, _depth: int, randint: Callable[[int, int], int]
+) -> Callable[[], Any]:
+    """Compile a generator for list[T], with 1-5 items."""
+    inner_type = get_args(field_type)[0] if get_args(field_type) else str
+    inner = _compile_field_mock(inner_type, field_name, _depth + 1)
+    return lambda: [inner() for _ in range(randint(1, 5))]
+
+
+def _dict_generator(
+    field_type: Any, field_name: str, _depth: int, randint: Callable[[int, int], int]
+) -> Callable[[], Any]:
+    """Compile a generator for dict[K, V], with 1-3 entries."""
+    key_type, value_type = get_args(field_type) if get_args(field_type) else (str, str)
+    key = _compile_field_mock(key_type, f"{field_name}_key", _depth + 1)
+    value = _compile_field_mock(value_type, f"{field_name}_value", _depth + 1)
+    return lambda: {key(): value() for _ in range(randint(1, 3))}
+
+
+def _set_generator(
+    field_type: Any, field_name: str, _depth: int, randint: Callable[[int, int], int]
+) -> Callable[[], Any]:
+    """Compile a generator for set[T], with up to 5 unique items."""
+    inner_type = get_args(field_type)[0] if get_args(field_type) else str
+    inner = _compile_field_mock(inner_type, field_name, _depth + 1)
+    # Generate more items than needed to ensure uniqueness
+    return lambda: set(_unique_items(inner, randint(1, 5)))
+
+
+def _frozenset_generator(
+    field_type: Any, field_name: str, _depth: int, randint: Callable[[int, int], int]
+) -> Callable[[], Any]:
+    """Compile a generator for frozenset[T], with up to 5 unique items."""
+    inner_type = get_args(field_type)[0] if get_args(field_type) else str
+    inner = _compile_field_mock(inner_type, field_name, _depth + 1)
+    return lambda: frozenset(_unique_items(inner, randint(1, 5)))
+
+
+# Generator factories for container types, keyed by get_origin()
+_CONTAINER_GENERATORS: dict[Any, Callable[..., Callable[[], Any]]] = {
+    list: _list_generator,
+    dict: _dict_generator,
+    set: _set_generator,
+    frozenset: _frozenset_generator,
+}
+
 
-    # Handle Literal types
-    if origin is Literal:
-        # Get all literal values and pick one randomly
-        literal_values = list(get_args(field_type))
-        return _get_faker().random_element(literal_values)
+def _float_generator(fake: Any, rng: Any) -> Callable[[], float]:
+    random_ = rng.random
+    return lambda: random_() * 100
+
+
+def _bool_generator(fake: Any, rng: Any) -> Callable[[], bool]:
+    getrandbits = rng.getrandbits
+    return lambda: getrandbits(1) == 1
+
+
+def _decimal_generator(fake: Any, rng: Any) -> Callable[[], Any]:
+    from decimal import Decimal
+
+    pyfloat = fake.pyfloat
+    return lambda: Decimal(str(pyfloat(left_digits=5, right_digits=2)))
+
+
+# Generator factories for standard Python types, taking (fake, rng)
+_BUILTIN_GENERATORS: dict[Any, Callable[[Any, Any], Callable[[], Any]]] = {
+    str: lambda fake, rng: fake.word,
+    # Same range as Faker's random_int()
+    int: lambda fake, rng: partial(rng.randrange, 10000),
+    float: _float_generator,
+    bool: _bool_generator,
+    bytes: lambda fake, rng: partial(fake.binary, length=32),
+}
+
+# Generator factories for common types matched by class name
+_NAMED_GENERATORS: dict[Any, Callable[[Any, Any], Callable[[], Any]]] = {
+    "date": lambda fake, rng: fake.date_object,
+    "datetime": lambda fake, rng: fake.date_time,
+    "time": lambda fake, rng: fake.time_object,
+    "Decimal": _decimal_generator,
+    "UUID": lambda fake, rng: _mock_uuid,
+}
+
+
+def _compile_field_mock(
+    field_type: Any, field_name: str = "", _depth: int = 0
+) -> Callable[[], Any]:
+    """Resolve a field's type into a generator producing mock values for it.
+
+    All type inspection happens here, once; the returned callable only
+    generates values. Model plans cache these per field.
+
+    Args:
+        field_type: The type annotation of the field
+        field_name: The name of the field (used for smart generation)
+        _depth: Recursion depth for nested types
+
+    Returns:
+        Zero-argument callable returning a mock value for the field type
+    """
+    fake = get_faker()
+    # Generator methods are bound once here; plans are rebuilt if set_rng replaces it
+    rng = get_rng()
+
+    # Get origin for type checking
+    origin = get_origin(field_type)
+
+    # Handle Optional types (Union with None) FIRST
+    inner_type = _optional_inner_type(field_type)
+    if inner_type is not None:
+        choices = _choices_for(inner_type)
+        if choices is not None:
+            return _choice_generator(_optional_choices(choices))
+        return _optional_generator(_compile_field_mock(inner_type, field_name, _depth + 1))
+
+    # Handle Enum and Literal types by picking one of their values randomly
+    choices = _choices_for(field_type)
+    if choices is not None:
+        return _choice_generator(choices)
 
     # Handle custom types with mock() class method
     if hasattr(field_type, "mock") and callable(field_type.mock):
-        return field_type.mock()
+        return field_type.mock
 
     # Handle nested dataclasses
     if is_dataclass(field_type):
         # Recursively generate mock for nested dataclass
-        return mock_factory(field_type)
+        return partial(mock_factory, field_type)
 
     # Handle Pydantic built-in types (v2 uses Annotated)
     if hasattr(field_type, "__module__") and "pydantic" in field_type.__module__:
-        return _generate_pydantic_type_mock(field_type, field_name)
+        return partial(_generate_pydantic_type_mock, field_type, field_name)
+
+    # Annotated metadata is read straight off the attribute, once per plan
+    annotated_metadata = getattr(field_type, "__metadata__", None)
 
     # Check if it's an Annotated type with Pydantic constraints
-    if origin is not None and hasattr(field_type, "__metadata__"):
+    if origin is not None and annotated_metadata is not None:
         # Check for Pydantic metadata markers
-        for metadata in field_type.__metadata__:
+        for metadata in annotated_metadata:
             if metadata is not None and hasattr(metadata, "__module__"):
                 module = getattr(metadata, "__module__", "")
                 if "pydantic" in module or "annotated_types" in module:
                     # This is a Pydantic constrained type
-                    return _generate_pydantic_annotated_mock(field_type, field_name)
+                    return _compile_pydantic_annotated_mock(field_type, field_name)
 
     # Handle Annotated types (e.g., Annotated[str, VARCHAR(50)])
-    if hasattr(field_type, "__metadata__"):  # It's an Annotated type
-        # Get the actual type and metadata
-        args = get_args(field_type)
-        if args:
-            actual_type = args[0]
-            metadata = getattr(field_type, "__metadata__", ())
-
-            # Look for mock provider in metadata
-            for item in metadata:
-                # Handle mock providers with mock() method (duck typing)
-                if hasattr(item, "mock") and callable(item.mock):
-                    return item.mock()
-
-            # If no mock provider found, continue with the actual type
-            field_type = actual_type
-
-    # Handle List types
-    if origin is list:
-        inner_type = get_args(field_type)[0] if get_args(field_type) else str
-        count = _get_faker().random_int(min=1, max=5)
-        return [_generate_field_mock(inner_type, field_name, _depth + 1) for _ in range(count)]
-
-    # Handle Dict types
-    if origin is dict:
-        key_type, value_type = get_args(field_type) if get_args(field_type) else (str, str)
-        count = _get_faker().random_int(min=1, max=3)
-        return {
-            _generate_field_mock(key_type, f"{field_name}_key", _depth + 1): _generate_field_mock(
-                value_type, f"{field_name}_value", _depth + 1
-            )
-            for _ in range(count)
-        }
-
-    # Handle Set types
-    if origin is set:
-        inner_type = get_args(field_type)[0] if get_args(field_type) else str
-        count = _get_faker().random_int(min=1, max=5)
-        # Generate more items than needed to ensure uniqueness
-        items = []
-        attempts = 0
-        while len(items) < count and attempts < count * 3:
-            item = _generate_field_mock(inner_type, field_name, _depth + 1)
-            if item not in items:
-                items.append(item)
-            attempts += 1
-        return set(items)
-
-    # Handle FrozenSet types
-    if origin is frozenset:
-        inner_type = get_args(field_type)[0] if get_args(field_type) else str
-        count = _get_faker().random_int(min=1, max=5)
-        items = []
-        attempts = 0
-        while len(items) < count and attempts < count * 3:
-            item = _generate_field_mock(inner_type, field_name, _depth + 1)
-            if item not in items:
-                items.append(item)
-            attempts += 1
-        return frozenset(items)
-
-    # Default generation for standard Python types
-
-    if field_type is str:
-        return _get_faker().word()
-    elif field_type is int:
-        return _get_faker().random_int()
-    elif field_type is float:
-        return _get_faker().random.random() * 100
-    elif field_type is bool:
-        return _get_faker().boolean()
-    elif field_type is bytes:
-        return _get_faker().binary(length=32)
-    elif hasattr(field_type, "__name__"):
-        # Check types by name for common built-in types
-        if field_type.__name__ == "date":
-            return _get_faker().date_object()
-        elif field_type.__name__ == "datetime":
-            return _get_faker().date_time()
-        elif field_type.__name__ == "time":
-            return _get_faker().time_object()
-        elif field_type.__name__ == "Decimal":
-            from decimal import Decimal
-
-            return Decimal(str(_get_faker().pyfloat(left_digits=5, right_digits=2)))
-        elif field_type.__name__ == "UUID":
-            # Handle uuid.UUID type
-            return str(_get_faker().uuid4())
-        else:
-            # Unknown type with __name__ attribute
-            return _handle_unsupported_type(field_type, field_name)
-    else:
-        # Unknown/unsupported type without __name__ attribute
-        return _handle_unsupported_type(field_type, field_name)
+    if annotated_metadata is not None:  # It's an Annotated type
+        # Look for mock provider in metadata
+        provider = _find_mock_provider(annotated_metadata)
+        if provider is not None:
+            return provider.mock
+
+        # If no mock provider found, continue with the actual type
+        field_type = getattr(field_type, "__origin__", field_type)
+
+    # Handle list/dict/set/frozenset types
+    container = _CONTAINER_GENERATORS.get(origin)
+    if container is not None:
+        return container(field_type, field_name, _depth, rng.randint)
+
+    # Default generation for standard Python types, then common types by name
+    try:
+        builtin = _BUILTIN_GENERATORS.get(field_type) or _NAMED_GENERATORS.get(
+            getattr(field_type, "__name__", None)
+        )
+    except TypeError:
+        # Unhashable annotations (e.g. a metaclass setting __hash__ = None)
+        builtin = None
+    if builtin is not None:
+        return builtin(fake, rng)
+
+    # Unknown/unsupported type
+    return _compile_unsupported_mock(field_type, field_name)
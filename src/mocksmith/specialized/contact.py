@@ -1,9 +1,35 @@
 """Contact information specialized types using V3 pattern."""
 
-from typing import Optional
+from itertools import count
+from typing import Any, Optional
 
+from mocksmith._random import add_listener, get_faker, get_rng
 from mocksmith.types.string import Varchar
 
+# Pools Email mocks are assembled from; a running number keeps addresses unique
+_EMAIL_NAMES = tuple(
+    "alex amy ben carol chris dana david emma eric grace henry ivy jack james jane john "
+    "julia kate laura leo lisa mark mary mike nina olivia paul rachel ryan sam sarah tom".split()
+)
+_EMAIL_DOMAINS = (
+    "example.com",
+    "example.net",
+    "example.org",
+    "gmail.com",
+    "hotmail.com",
+    "yahoo.com",
+)
+_email_numbers = count(1)
+
+
+def _reset_email_numbers(rng: Any) -> None:
+    """Restart email numbering so a new or reseeded generator repeats its emails."""
+    global _email_numbers
+    _email_numbers = count(1)
+
+
+add_listener(_reset_email_numbers)
+
 
 def PhoneNumber(length: int = 20) -> type:  # noqa: N802
     """Phone number type.
@@ -19,14 +45,9 @@ def PhoneNumber(length: int = 20) -> type:  # noqa: N802
         @classmethod
         def mock(cls) -> str:
             """Generate a phone number."""
-            try:
-                from faker import Faker  # type: ignore
-
-                fake = Faker()
-                phone = fake.phone_number()
-                return phone[: cls._length]
-            except ImportError:
-                raise ImportError("faker library is required for mock generation") from None
+            fake = get_faker()
+            phone = fake.phone_number()
+            return phone[: cls._length]
 
     return PhoneNumberType
 
@@ -48,36 +69,30 @@ def Email(  # noqa: N802
         @classmethod
         def mock(cls) -> str:
             """Generate an email address."""
-            try:
-                from faker import Faker  # type: ignore
-
-                fake = Faker()
-
-                if cls._endswith and cls._endswith.startswith("@"):
-                    # Generate email with specific domain
-                    domain = cls._endswith[1:]
-                    username = fake.user_name()
-                    email = f"{username}@{domain}"
-                else:
-                    email = fake.email()
-
-                # Apply transformations
-                if cls._to_lower:
-                    email = email.lower()
-                elif cls._to_upper:
-                    email = email.upper()
-
-                # Ensure max length
-                if len(email) > cls._length:
-                    # Truncate username part if too long
-                    at_index = email.index("@")
-                    domain_part = email[at_index:]
-                    max_username_len = cls._length - len(domain_part)
-                    username = email[:at_index][:max_username_len]
-                    email = username + domain_part
-
-                return email
-            except ImportError:
-                raise ImportError("faker library is required for mock generation") from None
+            rng = get_rng()
+            username = f"{rng.choice(_EMAIL_NAMES)}{next(_email_numbers)}"
+
+            if cls._endswith and cls._endswith.startswith("@"):
+                # Generate email with specific domain
+                email = f"{username}{cls._endswith}"
+            else:
+                email = f"{username}@{rng.choice(_EMAIL_DOMAINS)}"
+
+            # Apply transformations
+            if cls._to_lower:
+                email = email.lower()
+            elif cls._to_upper:
+                email = email.upper()
+
+            # Ensure max length
+            if len(email) > cls._length:
+                # Truncate username part if too long
+                at_index = email.index("@")
+                domain_part = email[at_index:]
+                max_username_len = cls._length - len(domain_part)
+                username = email[:at_index][:max_username_len]
+                email = username + domain_part
+
+            return email
 
     return EmailType
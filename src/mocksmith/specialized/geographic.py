@@ -1,7 +1,73 @@
 """Geographic specialized types using V3 pattern."""
 
+from mocksmith._random import get_faker, get_rng
 from mocksmith.types.string import Char, Varchar
 
+# ISO 3166-1 alpha-2 codes of sovereign states, sampled directly by CountryCode
+_COUNTRY_CODES = tuple(
+    "AD AE AF AG AL AM AO AR AT AU AZ BA BB BD BE BF BG BH BI BJ BN BO BR BS BT BW BY BZ CA CD "
+    "CF CG CH CI CL CM CN CO CR CU CV CY CZ DE DJ DK DM DO DZ EC EE EG ER ES ET FI FJ FM FR GA "
+    "GB GD GE GH GM GN GQ GR GT GW GY HN HR HT HU ID IE IL IN IQ IR IS IT JM JO JP KE KG KH KI "
+    "KM KN KP KR KW KZ LA LB LC LI LK LR LS LT LU LV LY MA MC MD ME MG MH MK ML MM MN MR MT MU "
+    "MV MW MX MY MZ NA NE NG NI NL NO NP NR NZ OM PA PE PG PH PK PL PS PT PW PY QA RO RS RU RW "
+    "SA SB SC SD SE SG SI SK SL SM SN SO SR ST SV SY SZ TD TG TH TJ TL TM TN TO TR TT TV TW TZ "
+    "UA UG US UY UZ VA VC VE VN VU WS YE ZA ZM ZW".split()
+)
+
+# US state names, sampled directly by State
+_US_STATES = (
+    "Alabama",
+    "Alaska",
+    "Arizona",
+    "Arkansas",
+    "California",
+    "Colorado",
+    "Connecticut",
+    "Delaware",
+    "Florida",
+    "Georgia",
+    "Hawaii",
+    "Idaho",
+    "Illinois",
+    "Indiana",
+    "Iowa",
+    "Kansas",
+    "Kentucky",
+    "Louisiana",
+    "Maine",
+    "Maryland",
+    "Massachusetts",
+    "Michigan",
+    "Minnesota",
+    "Mississippi",
+    "Missouri",
+    "Montana",
+    "Nebraska",
+    "Nevada",
+    "New Hampshire",
+    "New Jersey",
+    "New Mexico",
+    "New York",
+    "North Carolina",
+    "North Dakota",
+    "Ohio",
+    "Oklahoma",
+    "Oregon",
+    "Pennsylvania",
+    "Rhode Island",
+    "South Carolina",
+    "South Dakota",
+    "Tennessee",
+    "Texas",
+    "Utah",
+    "Vermont",
+    "Virginia",
+    "Washington",
+    "West Virginia",
+    "Wisconsin",
+    "Wyoming",
+)
+
 
 def CountryCode() -> type:  # noqa: N802
     """ISO 3166-1 alpha-2 country code (2 characters).
@@ -16,13 +82,12 @@ def CountryCode() -> type:  # noqa: N802
         @classmethod
         def mock(cls) -> str:
             """Generate a country code."""
-            try:
-                from faker import Faker  # type: ignore
+            return get_rng().choice(_COUNTRY_CODES)
 
-                fake = Faker()
-                return fake.country_code().upper()
-            except ImportError:
-                raise ImportError("faker library is required for mock generation") from None
+        @classmethod
+        def mock_many(cls, count: int) -> list[str]:
+            """Generate several country codes in one draw."""
+            return get_rng().choices(_COUNTRY_CODES, k=count)
 
     return CountryCodeType
 
@@ -41,19 +106,13 @@ def State(length: int = 50) -> type:  # noqa: N802
         @classmethod
         def mock(cls) -> str:
             """Generate a state/province name."""
-            try:
-                from faker import Faker  # type: ignore
-
-                fake = Faker()
-                # Try to get state name, fallback to generic word if not available
-                try:
-                    state = fake.state()
-                    return state[: cls._length]
-                except AttributeError:
-                    # Fallback for locales without states
-                    return fake.city()[: cls._length]
-            except ImportError:
-                raise ImportError("faker library is required for mock generation") from None
+            return get_rng().choice(_US_STATES)[: cls._length]
+
+        @classmethod
+        def mock_many(cls, count: int) -> list[str]:
+            """Generate several state/province names in one draw."""
+            length = cls._length
+            return [state[:length] for state in get_rng().choices(_US_STATES, k=count)]
 
     return StateType
 
@@ -72,14 +131,9 @@ def City(length: int = 100) -> type:  # noqa: N802
         @classmethod
         def mock(cls) -> str:
             """Generate a city name."""
-            try:
-                from faker import Faker  # type: ignore
-
-                fake = Faker()
-                city = fake.city()
-                return city[: cls._length]
-            except ImportError:
-                raise ImportError("faker library is required for mock generation") from None
+            fake = get_faker()
+            city = fake.city()
+            return city[: cls._length]
 
     return CityType
 
@@ -97,14 +151,7 @@ def ZipCode(length: int = 10) -> type:  # noqa: N802
     class ZipCodeType(VarcharType):
         @classmethod
         def mock(cls) -> str:
-            """Generate a postal code."""
-            try:
-                from faker import Faker  # type: ignore
-
-                fake = Faker()
-                postcode = fake.postcode()
-                return postcode[: cls._length]
-            except ImportError:
-                raise ImportError("faker library is required for mock generation") from None
+            """Generate a 5-digit US ZIP code, from a single random draw."""
+            return f"{get_rng().randrange(100000):05d}"[: cls._length]
 
     return ZipCodeType
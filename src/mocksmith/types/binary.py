@@ -2,6 +2,8 @@
 
 from typing import Any, ClassVar, Optional
 
+from mocksmith._random import get_rng
+
 try:
     from pydantic import GetCoreSchemaHandler  # type: ignore
     from pydantic_core import PydanticCustomError, core_schema  # type: ignore
@@ -123,25 +125,22 @@ class _BaseBinary(bytes):
 
     @classmethod
     def mock(cls) -> bytes:
-        """Generate mock binary data."""
-        try:
-            from faker import Faker  # type: ignore
-
-            fake = Faker()
-
-            if cls._length is not None:
-                # Fixed length
-                return fake.binary(length=cls._length)
-            elif cls._max_length is not None:
-                # Variable length up to max
-                length = fake.random_int(min=1, max=min(cls._max_length, 100))
-                return fake.binary(length=length)
-            else:
-                # BLOB without max - reasonable size
-                length = fake.random_int(min=100, max=1000)
-                return fake.binary(length=length)
-        except ImportError:
-            raise ImportError("faker library is required for mock generation") from None
+        """Generate mock binary data.
+
+        The bytes come from one ``randbytes`` call on the shared generator, so
+        ``mocksmith.seed()`` makes them reproducible.
+        """
+        rng = get_rng()
+
+        if cls._length is not None:
+            # Fixed length
+            return rng.randbytes(cls._length)
+        elif cls._max_length is not None:
+            # Variable length up to max
+            return rng.randbytes(rng.randint(1, min(cls._max_length, 100)))
+        else:
+            # BLOB without max - reasonable size
+            return rng.randbytes(rng.randint(100, 1000))
 
 
 class _BINARY(_BaseBinary):
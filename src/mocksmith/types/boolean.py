@@ -2,6 +2,8 @@
 
 from typing import Any, ClassVar
 
+from mocksmith._random import get_faker
+
 try:
     from pydantic import GetCoreSchemaHandler  # type: ignore
     from pydantic_core import PydanticCustomError, core_schema  # type: ignore
@@ -114,13 +116,8 @@ class _BOOLEAN(int):  # bool inherits from int in Python
     @classmethod
     def mock(cls) -> bool:
         """Generate mock boolean value."""
-        try:
-            from faker import Faker  # type: ignore
-
-            fake = Faker()
-            return fake.boolean()
-        except ImportError:
-            raise ImportError("faker library is required for mock generation") from None
+        fake = get_faker()
+        return fake.boolean()
 
 
 # Factory function for consistency with numeric types
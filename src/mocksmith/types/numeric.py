@@ -8,7 +8,10 @@ This module provides numeric types that:
 """
 
 from decimal import Decimal
-from typing import Any, ClassVar, Optional, Union
+from functools import lru_cache, partial
+from typing import Any, Callable, ClassVar, Optional, Union
+
+from mocksmith._random import add_listener, draw_ints, get_faker, get_rng
 
 try:
     from pydantic import GetCoreSchemaHandler  # type: ignore
@@ -22,10 +25,16 @@ except ImportError:
     core_schema = None
     PydanticCustomError = ValueError
 
+# Widest span of integer steps drawn in one batch; both the NumPy int64 draw and
+# the range() fallback overflow past 2**63
+_MAX_BATCH_STEPS = 2**62
+
 
 class _BaseInteger(int):
     """Base class for all integer types with SQL bounds and constraints."""
 
+    __slots__ = ()
+
     # To be defined by subclasses
     SQL_MIN: ClassVar[int]
     SQL_MAX: ClassVar[int]
@@ -41,26 +50,30 @@ class _BaseInteger(int):
 
     def __new__(cls, value: Any):
         """Create new integer with validation."""
-        # Handle string conversion
-        if isinstance(value, str):
-            try:
+        # Plain ints, the common case, need no conversion
+        if type(value) is not int:
+            # Handle string conversion
+            if isinstance(value, str):
+                try:
+                    value = int(value)
+                except (ValueError, TypeError):
+                    raise ValueError(
+                        f"{cls.SQL_TYPE} requires numeric value, got string '{value}'"
+                    ) from None
+
+            # Handle float conversion
+            if isinstance(value, float):
+                if not value.is_integer():
+                    raise ValueError(f"{cls.SQL_TYPE} requires integer value, got float {value}")
                 value = int(value)
-            except (ValueError, TypeError):
-                raise ValueError(
-                    f"{cls.SQL_TYPE} requires numeric value, got string '{value}'"
-                ) from None
 
-        # Handle float conversion
-        if isinstance(value, float):
-            if not value.is_integer():
-                raise ValueError(f"{cls.SQL_TYPE} requires integer value, got float {value}")
-            value = int(value)
-
-        if not isinstance(value, int):
-            raise ValueError(f"{cls.SQL_TYPE} requires integer value, got {type(value).__name__}")
+            if not isinstance(value, int):
+                raise ValueError(
+                    f"{cls.SQL_TYPE} requires integer value, got {type(value).__name__}"
+                )
 
         # Check SQL bounds
-        if value < cls.SQL_MIN or value > cls.SQL_MAX:
+        if not cls.SQL_MIN <= value <= cls.SQL_MAX:
             raise ValueError(
                 f"Value {value} out of {cls.SQL_TYPE} range ({cls.SQL_MIN} to {cls.SQL_MAX})"
             )
@@ -106,15 +119,12 @@ class _BaseInteger(int):
         )
 
     @classmethod
-    def mock(cls) -> int:
-        """Generate mock value respecting all constraints."""
-        try:
-            from faker import Faker  # type: ignore
-
-            fake = Faker()
-        except ImportError:
-            raise ImportError("faker library is required for mock generation") from None
+    @lru_cache(maxsize=512)
+    def _mock_bounds(cls) -> tuple[int, int, int]:
+        """Return the lowest and highest valid mock values and the step between them.
 
+        Constraints are fixed per class, so this is worked out once per class.
+        """
         # Calculate effective bounds
         min_val = cls.SQL_MIN
         max_val = cls.SQL_MAX
@@ -132,21 +142,39 @@ class _BaseInteger(int):
         if min_val > max_val:
             raise ValueError("No valid values exist with given constraints")
 
-        # Use full range - faker can handle large integers
-        faker_min = min_val
-        faker_max = max_val
+        if cls._multiple_of is None:
+            return min_val, max_val, 1
 
-        if cls._multiple_of is not None:
-            # Adjust min to be a valid multiple
-            if faker_min % cls._multiple_of != 0:
-                faker_min = faker_min + (cls._multiple_of - faker_min % cls._multiple_of)
+        # Adjust min to be a valid multiple
+        if min_val % cls._multiple_of != 0:
+            min_val = min_val + (cls._multiple_of - min_val % cls._multiple_of)
 
-            if faker_min > faker_max:
-                raise ValueError(f"No valid multiples of {cls._multiple_of} in range")
+        if min_val > max_val:
+            raise ValueError(f"No valid multiples of {cls._multiple_of} in range")
 
-            return fake.random_int(min=faker_min, max=faker_max, step=cls._multiple_of)
-        else:
-            return fake.random_int(min=faker_min, max=faker_max)
+        return min_val, max_val, cls._multiple_of
+
+    @classmethod
+    def mock(cls) -> int:
+        """Generate mock value respecting all constraints."""
+        return _integer_draw(cls)()
+
+    @classmethod
+    def mock_many(cls, count: int) -> list[int]:
+        """Generate several mock values.
+
+        Args:
+            count: Number of values to generate
+
+        Returns:
+            List of mock values
+        """
+        min_val, max_val, step = cls._mock_bounds()
+        steps = (max_val - min_val) // step
+        if steps > _MAX_BATCH_STEPS:
+            # Too wide for one batched draw (e.g. unconstrained BIGINT)
+            return [cls.mock() for _ in range(count)]
+        return [min_val + i * step for i in draw_ints(0, steps, count)]
 
     @property
     def sql_type(self) -> str:
@@ -164,6 +192,8 @@ class _BaseInteger(int):
 class _TINYINT(_BaseInteger):
     """8-bit integer (-128 to 127)."""
 
+    __slots__ = ()
+
     SQL_MIN = -128
     SQL_MAX = 127
     SQL_TYPE = "TINYINT"
@@ -172,6 +202,8 @@ class _TINYINT(_BaseInteger):
 class _SMALLINT(_BaseInteger):
     """16-bit integer (-32768 to 32767)."""
 
+    __slots__ = ()
+
     SQL_MIN = -32768
     SQL_MAX = 32767
     SQL_TYPE = "SMALLINT"
@@ -180,6 +212,8 @@ class _SMALLINT(_BaseInteger):
 class _INTEGER(_BaseInteger):
     """32-bit integer (-2147483648 to 2147483647)."""
 
+    __slots__ = ()
+
     SQL_MIN = -2147483648
     SQL_MAX = 2147483647
     SQL_TYPE = "INTEGER"
@@ -188,11 +222,75 @@ class _INTEGER(_BaseInteger):
 class _BIGINT(_BaseInteger):
     """64-bit integer."""
 
+    __slots__ = ()
+
     SQL_MIN = -9223372036854775808
     SQL_MAX = 9223372036854775807
     SQL_TYPE = "BIGINT"
 
 
+@lru_cache(maxsize=512)
+def _integer_draw(cls: type[_BaseInteger]) -> Callable[[], int]:
+    """Return a function drawing one mock value of an integer type.
+
+    Ranges holding a power-of-two count of values, which includes every
+    unconstrained SQL integer type, take their offset straight from
+    getrandbits() instead of going through randrange().
+    """
+    min_val, max_val, step = cls._mock_bounds()
+    count = (max_val - min_val) // step + 1
+    rng = get_rng()
+    if count & (count - 1):
+        return partial(rng.randrange, min_val, max_val + 1, step)
+
+    getrandbits = rng.getrandbits
+    bits = count.bit_length() - 1
+    if step == 1:
+        return lambda: min_val + getrandbits(bits)
+    return lambda: min_val + getrandbits(bits) * step
+
+
+def _reset_integer_draws(rng: Any) -> None:
+    """Drop draw functions bound to the previous generator."""
+    _integer_draw.cache_clear()
+
+
+add_listener(_reset_integer_draws)
+
+
+# Constrained classes are cached per constraint set, so repeated factory calls
+# return the same class and Pydantic builds its core schema only once
+@lru_cache(maxsize=512, typed=True)
+def _constrained_integer(
+    base: type,
+    name: str,
+    gt: Optional[int],
+    ge: Optional[int],
+    lt: Optional[int],
+    le: Optional[int],
+    multiple_of: Optional[int],
+    strict: bool,
+) -> type:
+    """Return the subclass of an integer type carrying the given constraints."""
+    if gt is None and ge is None and lt is None and le is None and multiple_of is None:
+        return base
+
+    return type(
+        name,
+        (base,),
+        {
+            "__module__": __name__,
+            "__slots__": (),
+            "_gt": gt,
+            "_ge": ge,
+            "_lt": lt,
+            "_le": le,
+            "_multiple_of": multiple_of,
+            "_strict": strict,
+        },
+    )
+
+
 # Factory functions for creating constrained types
 def TinyInt(  # noqa: N802
     *,
@@ -205,20 +303,7 @@ def TinyInt(  # noqa: N802
     **kwargs,  # Accept but ignore extra kwargs for compatibility
 ) -> type:
     """Create a constrained TINYINT type."""
-    if not any(
-        [gt is not None, ge is not None, lt is not None, le is not None, multiple_of is not None]
-    ):
-        return _TINYINT
-
-    class ConstrainedTinyInt(_TINYINT):
-        _gt = gt
-        _ge = ge
-        _lt = lt
-        _le = le
-        _multiple_of = multiple_of
-        _strict = strict
-
-    return ConstrainedTinyInt
+    return _constrained_integer(_TINYINT, "ConstrainedTinyInt", gt, ge, lt, le, multiple_of, strict)
 
 
 def SmallInt(  # noqa: N802
@@ -232,20 +317,9 @@ def SmallInt(  # noqa: N802
     **kwargs,
 ) -> type:
     """Create a constrained SMALLINT type."""
-    if not any(
-        [gt is not None, ge is not None, lt is not None, le is not None, multiple_of is not None]
-    ):
-        return _SMALLINT
-
-    class ConstrainedSmallInt(_SMALLINT):
-        _gt = gt
-        _ge = ge
-        _lt = lt
-        _le = le
-        _multiple_of = multiple_of
-        _strict = strict
-
-    return ConstrainedSmallInt
+    return _constrained_integer(
+        _SMALLINT, "ConstrainedSmallInt", gt, ge, lt, le, multiple_of, strict
+    )
 
 
 def Integer(  # noqa: N802
@@ -259,20 +333,7 @@ def Integer(  # noqa: N802
     **kwargs,
 ) -> type:
     """Create a constrained INTEGER type."""
-    if not any(
-        [gt is not None, ge is not None, lt is not None, le is not None, multiple_of is not None]
-    ):
-        return _INTEGER
-
-    class ConstrainedInteger(_INTEGER):
-        _gt = gt
-        _ge = ge
-        _lt = lt
-        _le = le
-        _multiple_of = multiple_of
-        _strict = strict
-
-    return ConstrainedInteger
+    return _constrained_integer(_INTEGER, "ConstrainedInteger", gt, ge, lt, le, multiple_of, strict)
 
 
 def BigInt(  # noqa: N802
@@ -286,20 +347,7 @@ def BigInt(  # noqa: N802
     **kwargs,
 ) -> type:
     """Create a constrained BIGINT type."""
-    if not any(
-        [gt is not None, ge is not None, lt is not None, le is not None, multiple_of is not None]
-    ):
-        return _BIGINT
-
-    class ConstrainedBigInt(_BIGINT):
-        _gt = gt
-        _ge = ge
-        _lt = lt
-        _le = le
-        _multiple_of = multiple_of
-        _strict = strict
-
-    return ConstrainedBigInt
+    return _constrained_integer(_BIGINT, "ConstrainedBigInt", gt, ge, lt, le, multiple_of, strict)
 
 
 # Specialized constraint types for common patterns
@@ -327,6 +375,8 @@ def NonPositiveInteger() -> type:  # noqa: N802
 class _DECIMAL(Decimal):
     """Fixed-point decimal type with precision and scale."""
 
+    __slots__ = ()
+
     # Default precision and scale
     _precision: ClassVar[int] = 10
     _scale: ClassVar[int] = 2
@@ -418,15 +468,12 @@ class _DECIMAL(Decimal):
         )
 
     @classmethod
-    def mock(cls) -> Decimal:
-        """Generate mock decimal value."""
-        try:
-            from faker import Faker  # type: ignore
-
-            fake = Faker()
-        except ImportError:
-            raise ImportError("faker library is required for mock generation") from None
+    @lru_cache(maxsize=512)
+    def _mock_bounds(cls) -> tuple[Decimal, Decimal]:
+        """Return the lowest and highest mock values for the precision, scale and constraints.
 
+        Constraints are fixed per class, so this is worked out once per class.
+        """
         # Calculate bounds based on precision/scale
         max_int_digits = cls._precision - cls._scale
         if max_int_digits > 0:
@@ -449,6 +496,15 @@ class _DECIMAL(Decimal):
         elif cls._le is not None:
             max_val = min(max_val, cls._le)
 
+        return min_val, max_val
+
+    @classmethod
+    def mock(cls) -> Decimal:
+        """Generate mock decimal value."""
+        fake = get_faker()
+        min_val, max_val = cls._mock_bounds()
+        max_int_digits = cls._precision - cls._scale
+
         if cls._multiple_of is not None:
             # Find valid multiples in range
             start_mult = int(min_val / cls._multiple_of)
@@ -488,12 +544,14 @@ class _DECIMAL(Decimal):
 class _NUMERIC(_DECIMAL):  # pyright: ignore[reportUnusedClass]
     """Alias for DECIMAL."""
 
-    pass
+    __slots__ = ()
 
 
 class _FLOAT(float):
     """Floating-point type."""
 
+    __slots__ = ()
+
     _gt: Optional[float] = None
     _ge: Optional[float] = None
     _lt: Optional[float] = None
@@ -557,12 +615,7 @@ class _FLOAT(float):
     @classmethod
     def mock(cls) -> float:
         """Generate mock float value."""
-        try:
-            from faker import Faker  # type: ignore
-
-            fake = Faker()
-        except ImportError:
-            raise ImportError("faker library is required for mock generation") from None
+        fake = get_faker()
 
         min_val = -10000.0
         max_val = 10000.0
@@ -605,6 +658,8 @@ class _FLOAT(float):
 class _DOUBLE(_FLOAT):  # pyright: ignore[reportUnusedClass]
     """Alias for FLOAT (double precision)."""
 
+    __slots__ = ()
+
     @property
     def sql_type(self) -> str:
         return "DOUBLE"
@@ -613,11 +668,68 @@ class _DOUBLE(_FLOAT):  # pyright: ignore[reportUnusedClass]
 class _REAL(_FLOAT):
     """Single precision float."""
 
+    __slots__ = ()
+
     @property
     def sql_type(self) -> str:
         return "REAL"
 
 
+@lru_cache(maxsize=512, typed=True)
+def _constrained_float(
+    base: type,
+    name: str,
+    gt: Optional[float],
+    ge: Optional[float],
+    lt: Optional[float],
+    le: Optional[float],
+    multiple_of: Optional[float],
+) -> type:
+    """Return the subclass of a float type carrying the given constraints."""
+    if gt is None and ge is None and lt is None and le is None and multiple_of is None:
+        return base
+
+    return type(
+        name,
+        (base,),
+        {
+            "__module__": __name__,
+            "__slots__": (),
+            "_gt": gt,
+            "_ge": ge,
+            "_lt": lt,
+            "_le": le,
+            "_multiple_of": multiple_of,
+        },
+    )
+
+
+@lru_cache(maxsize=512, typed=True)
+def _decimal_type(
+    precision: int,
+    scale: int,
+    gt: Optional[Union[Decimal, float, int, str]],
+    ge: Optional[Union[Decimal, float, int, str]],
+    lt: Optional[Union[Decimal, float, int, str]],
+    le: Optional[Union[Decimal, float, int, str]],
+    multiple_of: Optional[Union[Decimal, float, int]],
+) -> type:
+    """Return the DECIMAL subclass for a precision, scale and constraint set."""
+
+    class ConstrainedDecimal(_DECIMAL):
+        __slots__ = ()
+
+        _precision = precision
+        _scale = scale
+        _gt = Decimal(str(gt)) if gt is not None else None
+        _ge = Decimal(str(ge)) if ge is not None else None
+        _lt = Decimal(str(lt)) if lt is not None else None
+        _le = Decimal(str(le)) if le is not None else None
+        _multiple_of = Decimal(str(multiple_of)) if multiple_of is not None else None
+
+    return ConstrainedDecimal
+
+
 # Factory functions for Decimal types
 def DecimalType(  # noqa: N802
     precision: int = 10,
@@ -631,17 +743,7 @@ def DecimalType(  # noqa: N802
     **kwargs,
 ) -> type:
     """Create a DECIMAL type with specific precision and scale."""
-
-    class ConstrainedDecimal(_DECIMAL):
-        _precision = precision
-        _scale = scale
-        _gt = Decimal(str(gt)) if gt is not None else None
-        _ge = Decimal(str(ge)) if ge is not None else None
-        _lt = Decimal(str(lt)) if lt is not None else None
-        _le = Decimal(str(le)) if le is not None else None
-        _multiple_of = Decimal(str(multiple_of)) if multiple_of is not None else None
-
-    return ConstrainedDecimal
+    return _decimal_type(precision, scale, gt, ge, lt, le, multiple_of)
 
 
 def Numeric(precision: int = 10, scale: int = 2, **kwargs) -> type:  # noqa: N802
@@ -684,19 +786,7 @@ def Float(  # noqa: N802
     **kwargs,
 ) -> type:
     """Create a constrained FLOAT type."""
-    if not any(
-        [gt is not None, ge is not None, lt is not None, le is not None, multiple_of is not None]
-    ):
-        return _FLOAT
-
-    class ConstrainedFloat(_FLOAT):
-        _gt = gt
-        _ge = ge
-        _lt = lt
-        _le = le
-        _multiple_of = multiple_of
-
-    return ConstrainedFloat
+    return _constrained_float(_FLOAT, "ConstrainedFloat", gt, ge, lt, le, multiple_of)
 
 
 def Double(  # noqa: N802
@@ -709,19 +799,7 @@ def Double(  # noqa: N802
     **kwargs,
 ) -> type:
     """Create a DOUBLE type."""
-    if not any(
-        [gt is not None, ge is not None, lt is not None, le is not None, multiple_of is not None]
-    ):
-        return _DOUBLE
-
-    class ConstrainedDouble(_DOUBLE):
-        _gt = gt
-        _ge = ge
-        _lt = lt
-        _le = le
-        _multiple_of = multiple_of
-
-    return ConstrainedDouble
+    return _constrained_float(_DOUBLE, "ConstrainedDouble", gt, ge, lt, le, multiple_of)
 
 
 def Real(**kwargs) -> type:  # noqa: N802
@@ -729,14 +807,15 @@ def Real(**kwargs) -> type:  # noqa: N802
     if not any(kwargs.get(k) for k in ["gt", "ge", "lt", "le", "multiple_of"]):
         return _REAL
 
-    class ConstrainedReal(_REAL):
-        _gt = kwargs.get("gt")
-        _ge = kwargs.get("ge")
-        _lt = kwargs.get("lt")
-        _le = kwargs.get("le")
-        _multiple_of = kwargs.get("multiple_of")
-
-    return ConstrainedReal
+    return _constrained_float(
+        _REAL,
+        "ConstrainedReal",
+        kwargs.get("gt"),
+        kwargs.get("ge"),
+        kwargs.get("lt"),
+        kwargs.get("le"),
+        kwargs.get("multiple_of"),
+    )
 
 
 def ConstrainedFloat(**kwargs) -> type:  # noqa: N802
@@ -1,7 +1,12 @@
 """String types with V3 pattern - extends Python str type directly."""
 
+import re
+from functools import cache
+from string import ascii_letters
 from typing import Any, ClassVar, Optional
 
+from mocksmith._random import get_faker, get_rng
+
 try:
     from pydantic import GetCoreSchemaHandler  # type: ignore
     from pydantic_core import PydanticCustomError, core_schema  # type: ignore
@@ -14,7 +19,73 @@ except ImportError:
     PydanticCustomError = ValueError
 
 
-class _VARCHAR(str):
+# Corpus TEXT mocks are sliced from, and the offsets where its words start
+_LOREM_PARAGRAPH = (
+    "Lorem ipsum dolor sit amet, consectetur adipiscing elit, sed do eiusmod tempor "
+    "incididunt ut labore et dolore magna aliqua. Ut enim ad minim veniam, quis nostrud "
+    "exercitation ullamco laboris nisi ut aliquip ex ea commodo consequat. Duis aute irure "
+    "dolor in reprehenderit in voluptate velit esse cillum dolore eu fugiat nulla pariatur. "
+    "Excepteur sint occaecat cupidatat non proident, sunt in culpa qui officia deserunt "
+    "mollit anim id est laborum. "
+)
+_LOREM = _LOREM_PARAGRAPH * 10
+_LOREM_WORD_STARTS = tuple(
+    i for i in range(len(_LOREM_PARAGRAPH)) if i == 0 or _LOREM_PARAGRAPH[i - 1] == " "
+)
+
+
+def _lorem(length: int) -> str:
+    """Return length characters of lorem ipsum, starting at a random word.
+
+    The text never ends in a space, so stripping whitespace keeps its length.
+    """
+    corpus = _LOREM
+    if length > len(corpus) - len(_LOREM_PARAGRAPH):
+        corpus = _LOREM_PARAGRAPH * (length // len(_LOREM_PARAGRAPH) + 2)
+    start = get_rng().choice(_LOREM_WORD_STARTS)
+    text = corpus[start : start + length]
+    if text.endswith(" "):
+        text = text[:-1] + "."
+    return text
+
+
+@cache
+def _affix_pattern(startswith: Optional[str], endswith: Optional[str]) -> Optional[str]:
+    """Return the schema regex for a prefix/suffix pair, built once per pair."""
+    if startswith and endswith:
+        return f"^{re.escape(startswith)}.*{re.escape(endswith)}$"
+    if startswith:
+        return f"^{re.escape(startswith)}.*"
+    if endswith:
+        return f".*{re.escape(endswith)}$"
+    return None
+
+
+class _BaseString(str):
+    """Base class for the string types (internal use only)."""
+
+    @classmethod
+    def mock(cls) -> str:
+        """Generate a mock value respecting the type's constraints."""
+        raise NotImplementedError
+
+    @classmethod
+    def mock_many(cls, count: int) -> list[str]:
+        """Generate several mock values.
+
+        Subclasses with a genuinely batched draw override this.
+
+        Args:
+            count: Number of values to generate
+
+        Returns:
+            List of mock values
+        """
+        mock = cls.mock
+        return [mock() for _ in range(count)]
+
+
+class _VARCHAR(_BaseString):
     """Variable-length character string with constraints (internal use only)."""
 
     SQL_TYPE: ClassVar[str] = "VARCHAR"
@@ -89,17 +160,7 @@ class _VARCHAR(str):
             except ValueError as e:
                 raise PydanticCustomError("varchar_type", str(e)) from e
 
-        # Build regex pattern if needed
-        import re
-
-        pattern = None
-        if cls._startswith or cls._endswith:
-            if cls._startswith and cls._endswith:
-                pattern = f"^{re.escape(cls._startswith)}.*{re.escape(cls._endswith)}$"
-            elif cls._startswith:
-                pattern = f"^{re.escape(cls._startswith)}.*"
-            elif cls._endswith:
-                pattern = f".*{re.escape(cls._endswith)}$"
+        pattern = _affix_pattern(cls._startswith, cls._endswith)
 
         schema = core_schema.str_schema(  # type: ignore
             max_length=cls._length,
@@ -118,65 +179,61 @@ class _VARCHAR(str):
     @classmethod
     def mock(cls) -> str:
         """Generate mock varchar value."""
-        try:
-            from faker import Faker  # type: ignore
-
-            fake = Faker()
-
-            # Handle startswith/endswith constraints
-            if cls._startswith or cls._endswith:
-                prefix = cls._startswith or ""
-                suffix = cls._endswith or ""
-                prefix_suffix_len = len(prefix) + len(suffix)
-
-                if prefix_suffix_len >= cls._length:
-                    # No room for random content
-                    text = (prefix + suffix)[: cls._length]
-                else:
-                    # Calculate how many random chars we need
-                    min_middle = max(0, (cls._min_length or 1) - prefix_suffix_len)
-                    max_middle = cls._length - prefix_suffix_len
-
-                    # Generate middle part
-                    middle_chars = fake.random_int(min=min_middle, max=max_middle)
-                    middle = fake.pystr(min_chars=middle_chars, max_chars=middle_chars)
-
-                    text = prefix + middle + suffix
+        fake = get_faker()
+
+        # Handle startswith/endswith constraints
+        if cls._startswith or cls._endswith:
+            prefix = cls._startswith or ""
+            suffix = cls._endswith or ""
+            prefix_suffix_len = len(prefix) + len(suffix)
+
+            if prefix_suffix_len >= cls._length:
+                # No room for random content
+                text = (prefix + suffix)[: cls._length]
+            else:
+                # Calculate how many random chars we need
+                min_middle = max(0, (cls._min_length or 1) - prefix_suffix_len)
+                max_middle = cls._length - prefix_suffix_len
+
+                # Generate middle part, sampling all its letters in one call
+                rng = get_rng()
+                middle_chars = rng.randint(min_middle, max_middle)
+                middle = "".join(rng.choices(ascii_letters, k=middle_chars))
+
+                text = prefix + middle + suffix
+        else:
+            # Generate based on length
+            min_len = cls._min_length or 1
+
+            if cls._length <= 10:
+                text = fake.word()
+            elif cls._length <= 30:
+                text = fake.name()
+            elif cls._length <= 100:
+                text = fake.sentence(nb_words=6, variable_nb_words=True)
             else:
-                # Generate based on length
-                min_len = cls._min_length or 1
-
-                if cls._length <= 10:
-                    text = fake.word()
-                elif cls._length <= 30:
-                    text = fake.name()
-                elif cls._length <= 100:
-                    text = fake.sentence(nb_words=6, variable_nb_words=True)
-                else:
-                    text = fake.text(max_nb_chars=cls._length)
-
-                # Ensure minimum length
-                while len(text) < min_len:
-                    text += " " + fake.word()
-
-            # Apply transformations
-            if cls._strip_whitespace:
-                text = text.strip()
-            if cls._to_lower:
-                text = text.lower()
-            elif cls._to_upper:
-                text = text.upper()
-
-            # Ensure max length
-            if len(text) > cls._length:
-                text = text[: cls._length]
-
-            return text
-        except ImportError:
-            raise ImportError("faker library is required for mock generation") from None
-
-
-class _CHAR(str):
+                text = fake.text(max_nb_chars=cls._length)
+
+            # Ensure minimum length
+            while len(text) < min_len:
+                text += " " + fake.word()
+
+        # Apply transformations
+        if cls._strip_whitespace:
+            text = text.strip()
+        if cls._to_lower:
+            text = text.lower()
+        elif cls._to_upper:
+            text = text.upper()
+
+        # Ensure max length
+        if len(text) > cls._length:
+            text = text[: cls._length]
+
+        return text
+
+
+class _CHAR(_BaseString):
     """Fixed-length character string (internal use only)."""
 
     SQL_TYPE: ClassVar[str] = "CHAR"
@@ -248,17 +305,7 @@ class _CHAR(str):
             except ValueError as e:
                 raise PydanticCustomError("char_type", str(e)) from e
 
-        # Build regex pattern if needed
-        import re
-
-        pattern = None
-        if cls._startswith or cls._endswith:
-            if cls._startswith and cls._endswith:
-                pattern = f"^{re.escape(cls._startswith)}.*{re.escape(cls._endswith)}$"
-            elif cls._startswith:
-                pattern = f"^{re.escape(cls._startswith)}.*"
-            elif cls._endswith:
-                pattern = f".*{re.escape(cls._endswith)}$"
+        pattern = _affix_pattern(cls._startswith, cls._endswith)
 
         schema = core_schema.str_schema(  # type: ignore
             max_length=cls._length,
@@ -275,54 +322,41 @@ class _CHAR(str):
 
     @classmethod
     def mock(cls) -> str:
-        """Generate mock char value."""
-        try:
-            from faker import Faker  # type: ignore
-
-            fake = Faker()
-
-            # Handle startswith/endswith constraints
-            if cls._startswith or cls._endswith:
-                prefix = cls._startswith or ""
-                suffix = cls._endswith or ""
-                prefix_suffix_len = len(prefix) + len(suffix)
-
-                if prefix_suffix_len >= cls._length:
-                    text = (prefix + suffix)[: cls._length]
-                else:
-                    # For CHAR, we need exactly self._length characters
-                    middle_len = cls._length - prefix_suffix_len
-                    middle = fake.pystr(min_chars=middle_len, max_chars=middle_len)
-                    text = prefix + middle + suffix
-            else:
-                # Generate based on length
-                if cls._length <= 2:
-                    text = fake.country_code()
-                elif cls._length <= 10:
-                    text = fake.word()
-                else:
-                    text = fake.text(max_nb_chars=cls._length)
-
-            # Apply transformations
-            if cls._strip_whitespace:
-                text = text.strip()
-            if cls._to_lower:
-                text = text.lower()
-            elif cls._to_upper:
-                text = text.upper()
-
-            # Ensure exact length (CHAR is fixed-length)
-            if len(text) > cls._length:
-                text = text[: cls._length]
-            else:
-                text = text.ljust(cls._length)
+        """Generate mock char value.
+
+        The value is filled to the full fixed length with letters sampled in
+        one ``choices`` call, so it needs no padding.
+        """
+        prefix = cls._startswith or ""
+        suffix = cls._endswith or ""
+        prefix_suffix_len = len(prefix) + len(suffix)
+
+        if prefix_suffix_len >= cls._length:
+            # No room for random content
+            text = (prefix + suffix)[: cls._length]
+        else:
+            # For CHAR, we need exactly self._length characters
+            middle = "".join(get_rng().choices(ascii_letters, k=cls._length - prefix_suffix_len))
+            text = prefix + middle + suffix
 
-            return text
-        except ImportError:
-            raise ImportError("faker library is required for mock generation") from None
+        # Apply transformations
+        if cls._strip_whitespace:
+            text = text.strip()
+        if cls._to_lower:
+            text = text.lower()
+        elif cls._to_upper:
+            text = text.upper()
+
+        # Ensure exact length (CHAR is fixed-length)
+        if len(text) > cls._length:
+            text = text[: cls._length]
+        else:
+            text = text.ljust(cls._length)
+
+        return text
 
 
-class _TEXT(str):
+class _TEXT(_BaseString):
     """Variable-length text (internal use only)."""
 
     SQL_TYPE: ClassVar[str] = "TEXT"
@@ -395,17 +429,7 @@ class _TEXT(str):
             except ValueError as e:
                 raise PydanticCustomError("text_type", str(e)) from e
 
-        # Build regex pattern if needed
-        import re
-
-        pattern = None
-        if cls._startswith or cls._endswith:
-            if cls._startswith and cls._endswith:
-                pattern = f"^{re.escape(cls._startswith)}.*{re.escape(cls._endswith)}$"
-            elif cls._startswith:
-                pattern = f"^{re.escape(cls._startswith)}.*"
-            elif cls._endswith:
-                pattern = f".*{re.escape(cls._endswith)}$"
+        pattern = _affix_pattern(cls._startswith, cls._endswith)
 
         kwargs = {
             "strip_whitespace": cls._strip_whitespace,
@@ -428,87 +452,62 @@ class _TEXT(str):
 
     @classmethod
     def mock(cls) -> str:
-        """Generate mock text value."""
-        try:
-            from faker import Faker  # type: ignore
-
-            fake = Faker()
-
-            # Handle startswith/endswith constraints
-            if cls._startswith or cls._endswith:
-                prefix = cls._startswith or ""
-                suffix = cls._endswith or ""
-                prefix_suffix_len = len(prefix) + len(suffix)
-
-                # Determine target length
-                if cls._max_length and cls._min_length:
-                    target_length = fake.random_int(min=cls._min_length, max=cls._max_length)
-                elif cls._max_length:
-                    target_length = fake.random_int(
-                        min=max(prefix_suffix_len + 10, 50), max=cls._max_length
-                    )
-                elif cls._min_length:
-                    target_length = fake.random_int(min=cls._min_length, max=cls._min_length + 500)
-                else:
-                    target_length = fake.random_int(min=200, max=1000)
-
-                # Calculate middle content length
-                middle_length = target_length - prefix_suffix_len
-
-                if middle_length <= 0:
-                    text = (prefix + suffix)[:target_length]
-                elif middle_length <= 50:
-                    middle = fake.pystr(min_chars=middle_length, max_chars=middle_length)
-                    text = prefix + middle + suffix
-                else:
-                    middle = fake.text(max_nb_chars=middle_length * 2)
-                    middle = middle.strip()
-                    if len(middle) > middle_length:
-                        middle = middle[:middle_length].rstrip()
-                    elif len(middle) < middle_length:
-                        padding_needed = middle_length - len(middle)
-                        middle = (
-                            middle
-                            + " "
-                            + fake.pystr(min_chars=padding_needed - 1, max_chars=padding_needed - 1)
-                        )
-                    text = prefix + middle + suffix
+        """Generate mock text value.
+
+        The text is a slice of a precomputed lorem ipsum corpus, cut to the
+        target length.
+        """
+        randint = get_rng().randint
+
+        # Handle startswith/endswith constraints
+        if cls._startswith or cls._endswith:
+            prefix = cls._startswith or ""
+            suffix = cls._endswith or ""
+            prefix_suffix_len = len(prefix) + len(suffix)
+
+            # Determine target length
+            if cls._max_length and cls._min_length:
+                target_length = randint(cls._min_length, cls._max_length)
+            elif cls._max_length:
+                target_length = randint(max(prefix_suffix_len + 10, 50), cls._max_length)
+            elif cls._min_length:
+                target_length = randint(cls._min_length, cls._min_length + 500)
             else:
-                # Determine target length
-                if cls._max_length and cls._min_length:
-                    target_length = fake.random_int(min=cls._min_length, max=cls._max_length)
-                elif cls._max_length:
-                    target_length = fake.random_int(min=10, max=cls._max_length)
-                elif cls._min_length:
-                    target_length = fake.random_int(min=cls._min_length, max=cls._min_length + 500)
-                else:
-                    target_length = 500
-
-                # Generate text
-                if target_length <= 200:
-                    text = fake.paragraph(nb_sentences=3)
-                else:
-                    text = fake.text(max_nb_chars=target_length)
-
-                # Ensure min length
-                while cls._min_length and len(text) < cls._min_length:
-                    text += " " + fake.paragraph()
-
-            # Apply transformations
-            if cls._strip_whitespace:
-                text = text.strip()
-            if cls._to_lower:
-                text = text.lower()
-            elif cls._to_upper:
-                text = text.upper()
-
-            # Ensure max length
-            if cls._max_length and len(text) > cls._max_length:
-                text = text[: cls._max_length]
-
-            return text
-        except ImportError:
-            raise ImportError("faker library is required for mock generation") from None
+                target_length = randint(200, 1000)
+
+            # Calculate middle content length
+            middle_length = target_length - prefix_suffix_len
+
+            if middle_length <= 0:
+                text = (prefix + suffix)[:target_length]
+            else:
+                text = prefix + _lorem(middle_length) + suffix
+        else:
+            # Determine target length
+            if cls._max_length and cls._min_length:
+                target_length = randint(cls._min_length, cls._max_length)
+            elif cls._max_length:
+                target_length = randint(10, cls._max_length)
+            elif cls._min_length:
+                target_length = randint(cls._min_length, cls._min_length + 500)
+            else:
+                target_length = 500
+
+            text = _lorem(target_length)
+
+        # Apply transformations
+        if cls._strip_whitespace:
+            text = text.strip()
+        if cls._to_lower:
+            text = text.lower()
+        elif cls._to_upper:
+            text = text.upper()
+
+        # Ensure max length
+        if cls._max_length and len(text) > cls._max_length:
+            text = text[: cls._max_length]
+
+        return text
 
 
 # Factory functions
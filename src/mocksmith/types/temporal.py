@@ -3,6 +3,8 @@
 from datetime import date, datetime, time, timedelta, timezone
 from typing import Any, ClassVar, Optional
 
+from mocksmith._random import get_faker
+
 try:
     from pydantic import GetCoreSchemaHandler  # type: ignore
     from pydantic_core import PydanticCustomError, core_schema  # type: ignore
@@ -129,12 +131,7 @@ class _DATE(date):
     @classmethod
     def mock(cls) -> date:
         """Generate mock date value respecting constraints."""
-        try:
-            from faker import Faker  # type: ignore
-
-            fake = Faker()
-        except ImportError:
-            raise ImportError("faker library is required for mock generation") from None
+        fake = get_faker()
 
         # Calculate effective date bounds
         start_date = None
@@ -292,13 +289,8 @@ class _TIME(time):
     @classmethod
     def mock(cls) -> time:
         """Generate mock time value."""
-        try:
-            from faker import Faker  # type: ignore
-
-            fake = Faker()
-            return fake.time_object()
-        except ImportError:
-            raise ImportError("faker library is required for mock generation") from None
+        fake = get_faker()
+        return fake.time_object()
 
 
 class _DATETIME(datetime):
@@ -457,15 +449,10 @@ class _DATETIME(datetime):
     @classmethod
     def mock(cls) -> datetime:
         """Generate mock datetime value."""
-        try:
-            from faker import Faker  # type: ignore
-
-            fake = Faker()
-            # Return without timezone for DATETIME
-            dt = fake.date_time()
-            return dt.replace(tzinfo=None)
-        except ImportError:
-            raise ImportError("faker library is required for mock generation") from None
+        fake = get_faker()
+        # Return without timezone for DATETIME
+        dt = fake.date_time()
+        return dt.replace(tzinfo=None)
 
 
 class _TIMESTAMP(datetime):
@@ -631,18 +618,13 @@ class _TIMESTAMP(datetime):
     @classmethod
     def mock(cls) -> datetime:
         """Generate mock timestamp value."""
-        try:
-            from faker import Faker  # type: ignore
-
-            fake = Faker()
-            dt = fake.date_time()
-            if cls._with_timezone:
-                # Add UTC timezone
-                return dt.replace(tzinfo=timezone.utc)
-            else:
-                return dt.replace(tzinfo=None)
-        except ImportError:
-            raise ImportError("faker library is required for mock generation") from None
+        fake = get_faker()
+        dt = fake.date_time()
+        if cls._with_timezone:
+            # Add UTC timezone
+            return dt.replace(tzinfo=timezone.utc)
+        else:
+            return dt.replace(tzinfo=None)
 
 
 # Factory functions
@@ -0,0 +1,18 @@
+"""Shared pytest fixtures."""
+
+import pytest
+
+from mocksmith import seed
+from mocksmith._random import get_faker
+
+
+@pytest.fixture(autouse=True)
+def _seed_mocks():
+    """Seed mock generation so every test sees reproducible data."""
+    seed(0)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _warm_faker():
+    """Create the shared Faker instance once, before the first test needs it."""
+    get_faker()
@@ -2,7 +2,7 @@
 
 import pytest
 
-from mocksmith import Binary, Blob, Boolean, VarBinary
+from mocksmith import Binary, Blob, Boolean, VarBinary, seed
 from mocksmith.types.binary import _BINARY as BINARY
 from mocksmith.types.binary import _BLOB as BLOB
 from mocksmith.types.binary import _VARBINARY as VARBINARY
@@ -224,6 +224,13 @@ class TestBLOB:
         assert isinstance(mocked2, bytes)
         assert 1 <= len(mocked2) <= 100  # Limited range
 
+    def test_mock_is_seeded(self):
+        BlobType = Blob()
+        seed(7)
+        first = BlobType.mock()
+        seed(7)
+        assert BlobType.mock() == first
+
 
 class TestPydanticIntegration:
     """Test integration with Pydantic models."""
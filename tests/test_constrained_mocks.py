@@ -14,20 +14,15 @@ from mocksmith import (
     mockable,
 )
 
-# Try to import pydantic, but tests should work without it
-try:
-    from pydantic import BaseModel, ValidationError, condecimal, confloat, conint
-
-    PYDANTIC_AVAILABLE = True
-except ImportError:
-    PYDANTIC_AVAILABLE = False
-    ValidationError = ValueError  # Use ValueError when pydantic not available
-
-
-# Skip pydantic-specific tests if not available
-pytestmark = pytest.mark.skipif(
-    not PYDANTIC_AVAILABLE, reason="These tests require pydantic for BaseModel support"
+# Skip the whole module if pydantic is not available
+pydantic = pytest.importorskip(
+    "pydantic", reason="These tests require pydantic for BaseModel support"
 )
+BaseModel = pydantic.BaseModel
+ValidationError = pydantic.ValidationError
+condecimal = pydantic.condecimal
+confloat = pydantic.confloat
+conint = pydantic.conint
 
 
 class TestConstrainedMoneyMocks:
@@ -108,10 +103,7 @@ class TestConstrainedDecimalMocks:
             assert isinstance(m.value, Decimal)
             assert 0 <= m.value <= 100
             # Check decimal places
-            str_val = str(m.value)
-            if "." in str_val:
-                decimal_places = len(str_val.split(".")[1])
-                assert decimal_places <= 2
+            assert -m.value.as_tuple().exponent <= 2
 
     def test_constrained_decimal_precision(self):
         """Test decimal with high precision."""
@@ -124,10 +116,7 @@ class TestConstrainedDecimalMocks:
             p = Precise.mock()
             assert 0 < p.value < 1
             # Check it generates with appropriate precision
-            str_val = str(p.value)
-            if "." in str_val:
-                decimal_places = len(str_val.split(".")[1])
-                assert decimal_places <= 10
+            assert -p.value.as_tuple().exponent <= 10
 
 
 class TestConstrainedFloatMocks:
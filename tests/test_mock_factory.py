@@ -1,15 +1,39 @@
 """Tests for mock factory and class-level mock generation."""
 
+import random
+import sys
 from dataclasses import dataclass
-from datetime import date, datetime
+from datetime import date, datetime, time
 from decimal import Decimal
-from typing import Annotated, Optional
+from enum import Enum
+from typing import Annotated, Literal, Optional
+from uuid import UUID
 
 import pytest
 
-from mocksmith import Varchar, mock_factory, mockable
+from mocksmith import (
+    Binary,
+    Boolean,
+    Date,
+    DecimalType,
+    Float,
+    Integer,
+    Time,
+    Timestamp,
+    VarBinary,
+    Varchar,
+    _random,
+    mock_factory,
+    mockable,
+    seed,
+    set_rng,
+)
+from mocksmith._random import get_rng
 from mocksmith.specialized import City, CountryCode, PhoneNumber
 
+# Slotted dataclasses (Python 3.10+) also cover mock_factory on __slots__ classes
+SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 # Import Pydantic if available
 try:
     from pydantic import BaseModel
@@ -25,7 +49,7 @@ class TestMockFactory:
     def test_mock_dataclass_basic(self):
         """Test mocking a basic dataclass."""
 
-        @dataclass
+        @dataclass(**SLOTS)
         class SimpleModel:
             name: str
             age: int
@@ -44,7 +68,7 @@ class TestMockFactory:
         PhoneType = PhoneNumber()
         CityType = City()
 
-        @dataclass
+        @dataclass(**SLOTS)
         class UserModel:
             username: UsernameType
             phone: PhoneType
@@ -60,7 +84,7 @@ class TestMockFactory:
     def test_mock_with_overrides(self):
         """Test mocking with field overrides."""
 
-        @dataclass
+        @dataclass(**SLOTS)
         class Product:
             name: str
             price: float
@@ -72,45 +96,51 @@ class TestMockFactory:
         assert mock.price == 99.99
         assert isinstance(mock.stock, int)  # Auto-generated
 
+    def test_mock_nested_with_overrides(self):
+        """Test that overrides do not leak between nested or successive mocks."""
+
+        @dataclass(**SLOTS)
+        class Inner:
+            name: str
+            count: int
+
+        @dataclass(**SLOTS)
+        class Outer:
+            name: str
+            inner: Inner
+
+        first = mock_factory(Outer, name="outer")
+        second = mock_factory(Outer)
+
+        assert first.name == "outer"
+        assert first.inner.name != "outer"
+        assert second.name != "outer"
+        assert isinstance(second.inner, Inner)
+
     def test_mock_with_optional_fields(self):
         """Test mocking with optional fields."""
 
-        @dataclass
+        @dataclass(**SLOTS)
         class OptionalModel:
             required: str
             optional: Optional[str] = None
             maybe_int: Optional[int] = None
 
-        # Test that optional fields CAN be None and CAN have values
-        # Generate many samples to ensure we see both behaviors
-        has_none = False
-        has_value = False
-
-        # Try up to 100 times to see both behaviors
-        for _ in range(100):
-            mock = mock_factory(OptionalModel)
+        # Seed so the sample is reproducible rather than probing until both appear
+        seed(1234)
+        mocks = [mock_factory(OptionalModel) for _ in range(20)]
 
-            # Required field should always be present
-            assert isinstance(mock.required, str)
-
-            # Check if we've seen both None and values for optional fields
-            if mock.optional is None or mock.maybe_int is None:
-                has_none = True
-            if mock.optional is not None or mock.maybe_int is not None:
-                has_value = True
-
-            # If we've seen both behaviors, the test passes
-            if has_none and has_value:
-                break
+        # Required field should always be present
+        assert all(isinstance(m.required, str) for m in mocks)
 
-        # Verify we saw both behaviors
-        assert has_none, "Never generated None for optional fields in 100 attempts"
-        assert has_value, "Never generated values for optional fields in 100 attempts"
+        # Optional fields CAN be None and CAN have values
+        assert any(m.optional is None or m.maybe_int is None for m in mocks)
+        assert any(m.optional is not None or m.maybe_int is not None for m in mocks)
 
     def test_mock_with_python_types(self):
         """Test mocking with various Python built-in types."""
 
-        @dataclass
+        @dataclass(**SLOTS)
         class PythonTypes:
             text: str
             number: int
@@ -130,6 +160,25 @@ class TestMockFactory:
         assert isinstance(mock.datetime_field, datetime)
         assert isinstance(mock.binary, bytes)
 
+    def test_mock_uuid_fields(self):
+        """Test that UUID fields get distinct, valid version 4 UUIDs."""
+
+        @dataclass(**SLOTS)
+        class Identified:
+            id: UUID
+            parent_id: UUID
+
+        mocks = [mock_factory(Identified) for _ in range(300)]
+        values = [m.id for m in mocks] + [m.parent_id for m in mocks]
+
+        assert len(set(values)) == len(values)
+        assert all(UUID(value).version == 4 for value in values)
+
+        seed(5)
+        first = mock_factory(Identified)
+        seed(5)
+        assert mock_factory(Identified) == first
+
     def test_mock_unsupported_class(self):
         """Test that mock_factory raises for unsupported classes."""
 
@@ -140,6 +189,41 @@ class TestMockFactory:
         with pytest.raises(TypeError, match="only supports dataclasses"):
             mock_factory(RegularClass)
 
+    def test_seed_makes_mocks_reproducible(self):
+        """Test that seeding reproduces the same mock data."""
+
+        @dataclass(**SLOTS)
+        class Model:
+            name: str
+            count: int
+            tag: Optional[str] = None
+
+        seed(42)
+        first = [mock_factory(Model) for _ in range(5)]
+        seed(42)
+        second = [mock_factory(Model) for _ in range(5)]
+
+        assert first == second
+
+    def test_set_rng_replaces_generator(self):
+        """Test that mock generation draws from an injected generator."""
+
+        @dataclass(**SLOTS)
+        class Model:
+            name: str
+            count: int
+
+        original = get_rng()
+        try:
+            set_rng(random.Random(7))
+            first = mock_factory(Model)
+            set_rng(random.Random(7))
+            second = mock_factory(Model)
+        finally:
+            set_rng(original)
+
+        assert first == second
+
 
 class TestMockableDecorator:
     """Test the @mockable decorator."""
@@ -148,7 +232,7 @@ class TestMockableDecorator:
         """Test that @mockable adds a mock() class method."""
 
         @mockable
-        @dataclass
+        @dataclass(**SLOTS)
         class Model:
             name: str
             value: int
@@ -165,7 +249,7 @@ class TestMockableDecorator:
         """Test that @mockable adds a mock_builder() method."""
 
         @mockable
-        @dataclass
+        @dataclass(**SLOTS)
         class Model:
             name: str
             value: int
@@ -181,18 +265,43 @@ class TestMockableDecorator:
         """Test @mockable with builder=False."""
 
         @mockable(builder=False)
-        @dataclass
+        @dataclass(**SLOTS)
         class Model:
             name: str
 
         assert hasattr(Model, "mock")
         assert not hasattr(Model, "mock_builder")
 
+    def test_mockable_is_idempotent(self):
+        """Test that re-applying @mockable leaves the class untouched."""
+
+        @mockable
+        @dataclass(**SLOTS)
+        class Model:
+            name: str
+
+        mock_method = Model.__dict__["mock"]
+        assert mockable(Model) is Model
+        assert mockable(builder=False)(Model) is Model
+        assert Model.__dict__["mock"] is mock_method
+
+    def test_mockable_adds_builder_on_redecoration(self):
+        """Test that re-decorating with builder=True adds the missing builder."""
+
+        @mockable(builder=False)
+        @dataclass(**SLOTS)
+        class Model:
+            name: str
+
+        assert not hasattr(Model, "mock_builder")
+        mockable(Model)
+        assert Model.mock_builder().with_name("x").build().name == "x"
+
     def test_mock_method_with_overrides(self):
         """Test using mock() method with overrides."""
 
         @mockable
-        @dataclass
+        @dataclass(**SLOTS)
         class Product:
             name: str
             price: Decimal
@@ -212,7 +321,7 @@ class TestMockBuilder:
         """Test basic builder functionality."""
 
         @mockable
-        @dataclass
+        @dataclass(**SLOTS)
         class Model:
             name: str
             count: int
@@ -228,24 +337,79 @@ class TestMockBuilder:
         """Test building multiple instances."""
 
         @mockable
-        @dataclass
+        @dataclass(**SLOTS)
         class Item:
             name: str
             quantity: int
 
+        seed(1234)
         items = Item.mock_builder().with_values(name="Widget").build_many(5)
 
+        assert isinstance(items, list)
         assert len(items) == 5
         assert all(item.name == "Widget" for item in items)
         # Quantities should be different (randomly generated)
-        quantities = [item.quantity for item in items]
-        assert len(set(quantities)) > 1
+        first, *rest = (item.quantity for item in items)
+        assert any(quantity != first for quantity in rest)
+
+    @pytest.mark.parametrize("use_numpy", [True, False], ids=["numpy", "stdlib"])
+    def test_builder_build_many_batched_fields(self, monkeypatch, use_numpy):
+        """Test build_many on fields drawn in bulk, with and without NumPy."""
+        if use_numpy:
+            pytest.importorskip("numpy")
+        monkeypatch.setattr(_random, "NUMPY_AVAILABLE", use_numpy)
+
+        class Color(Enum):
+            RED = "red"
+            BLUE = "blue"
+
+        @mockable
+        @dataclass(**SLOTS)
+        class Row:
+            env: Literal["dev", "staging", "prod"]
+            color: Color
+            flag: bool
+            count: int
+            ratio: float
+            size: Integer(ge=1, le=5)
+            level: Optional[Literal[1, 2, 3]] = 2
+            note: Optional[str] = None
+
+        seed(3)
+        rows = Row.mock_builder().build_many(200)
+        seed(3)
+        assert Row.mock_builder().build_many(200) == rows
+
+        assert {row.env for row in rows} == {"dev", "staging", "prod"}
+        assert {row.color for row in rows} == {Color.RED, Color.BLUE}
+        assert {row.flag for row in rows} == {True, False}
+        assert all(0 <= row.count <= 9999 for row in rows)
+        assert all(0 <= row.ratio < 100 for row in rows)
+        assert {row.size for row in rows} == {1, 2, 3, 4, 5}
+        # None falls back to the field default, as with single mocks
+        assert {row.level for row in rows} == {1, 2, 3}
+        assert any(row.note is None for row in rows)
+        assert any(isinstance(row.note, str) for row in rows)
+
+    def test_builder_build_many_passes_none_overrides(self):
+        """Test that a None override is kept rather than replaced by the default."""
+
+        @mockable
+        @dataclass(**SLOTS)
+        class Model:
+            name: str
+            tag: Optional[str] = "default"
+
+        models = Model.mock_builder().with_tag(None).build_many(3)
+
+        assert [model.tag for model in models] == [None, None, None]
+        assert all(isinstance(model.name, str) for model in models)
 
     def test_builder_invalid_field(self):
         """Test builder with invalid field name."""
 
         @mockable
-        @dataclass
+        @dataclass(**SLOTS)
         class Model:
             valid_field: str
 
@@ -254,6 +418,22 @@ class TestMockBuilder:
         with pytest.raises(AttributeError, match="No field named 'invalid_field'"):
             builder.with_values(invalid_field="value")
 
+    def test_builder_setters_live_on_class(self):
+        """Test that builders are slotted and share one class per target."""
+
+        @mockable
+        @dataclass(**SLOTS)
+        class Model:
+            name: str
+
+        first = Model.mock_builder()
+        second = Model.mock_builder()
+
+        assert type(first) is type(second)
+        assert not hasattr(first, "__dict__")
+        assert first.with_name("a") is first
+        assert second._overrides == {}
+
 
 @pytest.mark.skipif(not PYDANTIC_AVAILABLE, reason="Pydantic not installed")
 class TestPydanticMocking:
@@ -275,7 +455,6 @@ class TestPydanticMocking:
 
     def test_mock_pydantic_with_db_types(self):
         """Test mocking a Pydantic model with db_types using annotations."""
-        from mocksmith import Boolean, Integer, Varchar
 
         class UserModel(BaseModel):
             username: Varchar(30)
@@ -311,7 +490,6 @@ class TestPydanticMocking:
 
     def test_mockable_decorator_with_pydantic(self):
         """Test @mockable decorator with Pydantic models."""
-        from mocksmith import Integer, Varchar
 
         @mockable
         class Product(BaseModel):
@@ -341,50 +519,27 @@ class TestPydanticMocking:
 
     def test_pydantic_optional_fields(self):
         """Test mocking Pydantic models with optional fields."""
-        from mocksmith import Varchar
 
         class OptionalModel(BaseModel):
             required: Varchar(50)
             optional: Optional[Varchar(100)] = None
             maybe_int: Optional[int] = None
 
-        # Generate multiple to test optional behavior
-        # Generate more samples to ensure we see variation
+        # Seed so the sample is reproducible
+        seed(1234)
         mocks = [mock_factory(OptionalModel) for _ in range(50)]
 
         # All should have required field
         assert all(isinstance(m.required, str) for m in mocks)
 
-        # Check that optional fields sometimes have values, sometimes None
-        has_optional = sum(1 for m in mocks if m.optional is not None)
-        has_maybe_int = sum(1 for m in mocks if m.maybe_int is not None)
-
-        # With 80% chance of having values, we expect most to have values
-        # but with 50 samples, we should see at least some None values
-        # Allow for edge cases where all or none have values (very rare but possible)
-        assert 0 <= has_optional <= 50, f"has_optional={has_optional} should be between 0 and 50"
-        assert 0 <= has_maybe_int <= 50, f"has_maybe_int={has_maybe_int} should be between 0 and 50"
-
-        # The important test is that optional fields CAN be None or have values
-        # Check that we can generate both states (test a few times to be sure)
-        can_be_none = False
-        can_have_value = False
-
-        for _ in range(10):
-            test_mock = mock_factory(OptionalModel)
-            if test_mock.optional is None:
-                can_be_none = True
-            else:
-                can_have_value = True
-            if can_be_none and can_have_value:
-                break
-
-        # Note: This test might still occasionally fail due to randomness,
-        # but it's much less likely with 10 attempts
+        # Optional fields have values ~80% of the time, so 50 samples see both states
+        has_optional = sum(m.optional is not None for m in mocks)
+        has_maybe_int = sum(m.maybe_int is not None for m in mocks)
+        assert 0 < has_optional < 50, f"has_optional={has_optional} should be between 0 and 50"
+        assert 0 < has_maybe_int < 50, f"has_maybe_int={has_maybe_int} should be between 0 and 50"
 
     def test_pydantic_validation_on_mock(self):
         """Test that mocked data passes Pydantic validation."""
-        from mocksmith import Integer, Varchar
 
         @mockable
         class ValidatedModel(BaseModel):
@@ -405,48 +560,27 @@ class TestPydanticMocking:
 class TestDefaultMockImplementation:
     """Test the default mock implementation for database types."""
 
-    def test_numeric_types_default_mock(self):
-        """Test that numeric types use default mock implementation."""
-        from mocksmith import DecimalType, Float, Integer
-
-        # These should all work with default implementation
-        int_mock = Integer().mock()
-        assert isinstance(int_mock, int)
-
-        float_mock = Float().mock()
-        assert isinstance(float_mock, float)
-
-        decimal_mock = DecimalType(10, 2).mock()
-        assert isinstance(decimal_mock, Decimal)
-
-    def test_temporal_types_default_mock(self):
-        """Test that temporal types use default mock implementation."""
-        from datetime import time
-
-        from mocksmith import Date, Time, Timestamp
-
-        DateType = Date()
-        date_mock = DateType.mock()
-        assert isinstance(date_mock, date)
-
-        TimeType = Time()
-        time_mock = TimeType.mock()
-        assert isinstance(time_mock, time)
-
-        TimestampType = Timestamp()
-        timestamp_mock = TimestampType.mock()
-        assert isinstance(timestamp_mock, datetime)
-
-    def test_binary_types_default_mock(self):
-        """Test that binary types use default mock implementation."""
-        from mocksmith import Binary, VarBinary
-
-        BinaryType = Binary(32)
-        binary_mock = BinaryType.mock()
-        assert isinstance(binary_mock, bytes)
-        assert len(binary_mock) == 32
-
-        VarBinaryType = VarBinary(64)
-        varbinary_mock = VarBinaryType.mock()
-        assert isinstance(varbinary_mock, bytes)
-        assert len(varbinary_mock) <= 64
+    @pytest.mark.parametrize(
+        "db_type,expected_type,max_length",
+        [
+            (Integer(), int, None),
+            (Float(), float, None),
+            (DecimalType(10, 2), Decimal, None),
+            (Date(), date, None),
+            (Time(), time, None),
+            (Timestamp(), datetime, None),
+            (Binary(32), bytes, 32),
+            (VarBinary(64), bytes, 64),
+        ],
+        ids=["integer", "float", "decimal", "date", "time", "timestamp", "binary", "varbinary"],
+    )
+    def test_default_mock(self, db_type, expected_type, max_length):
+        """Test that database types use the default mock implementation."""
+        value = db_type.mock()
+        assert isinstance(value, expected_type)
+        if max_length is not None:
+            assert len(value) <= max_length
+
+    def test_binary_default_mock_is_fixed_length(self):
+        """Test that fixed-length binary mocks fill the full length."""
+        assert len(Binary(32).mock()) == 32
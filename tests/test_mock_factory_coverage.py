@@ -1,11 +1,18 @@
 """Additional tests for mock_factory to improve coverage without pydantic."""
 
+import gc
 import warnings
-from dataclasses import dataclass
-from typing import Optional
+import weakref
+from dataclasses import InitVar, dataclass
+from typing import Annotated, Optional
 
 from mocksmith import Integer, Varchar
-from mocksmith.mock_factory import _handle_unsupported_type, mock_factory
+from mocksmith.mock_factory import (
+    _CONSTRUCTOR_FACTORIES,
+    _MODEL_PLANS,
+    _handle_unsupported_type,
+    mock_factory,
+)
 
 
 class TestMockFactoryInternals:
@@ -115,6 +122,118 @@ class TestMockFactoryInternals:
             result = _handle_unsupported_type(TypeWithZero, "field4")
             assert result.value == "zero"
 
+    def test_handle_unsupported_type_caches_recipe(self):
+        """Test that an unsupported type is probed and warned about only once."""
+        attempts = []
+
+        class Unmockable:
+            def __init__(self, value):
+                attempts.append(value)
+                raise ValueError("Cannot instantiate")
+
+        class ZeroOnly:
+            def __init__(self, value):
+                attempts.append(value)
+                if value != 0:
+                    raise ValueError("Must be zero")
+
+        @dataclass
+        class ModelWithUnhashable:
+            blob: Unmockable
+
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter("always")
+            mocks = [mock_factory(ModelWithUnhashable) for _ in range(3)]
+        assert [mock.blob for mock in mocks] == [None] * 3
+        assert len(w) == 1
+        assert attempts == [None, "", 0]
+
+        attempts.clear()
+        results = [_handle_unsupported_type(ZeroOnly, "counter") for _ in range(3)]
+        assert all(isinstance(result, ZeroOnly) for result in results)
+        # One probe sequence, then each call goes straight to the working argument
+        assert attempts == [None, "", 0, 0, 0]
+
+    def test_unsupported_type_warns_once_per_model_field(self):
+        """Test that every model field of an unsupported type gets its own warning."""
+
+        class Unmockable:
+            def __init__(self, value):
+                raise ValueError("Cannot instantiate")
+
+        @dataclass
+        class First:
+            blob: Unmockable
+
+        @dataclass
+        class Second:
+            payload: Unmockable
+
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter("always")
+            for _ in range(2):
+                mock_factory(First)
+                mock_factory(Second)
+        assert len(w) == 2
+        assert "'blob'" in str(w[0].message)
+        assert "'payload'" in str(w[1].message)
+
+    def test_unsupported_recipe_cache_does_not_keep_type_alive(self):
+        """Test that caching a construction recipe does not leak the type."""
+
+        def probe_local_type():
+            class ZeroOnly:
+                def __init__(self, value):
+                    if value != 0:
+                        raise ValueError("Must be zero")
+
+            assert isinstance(_handle_unsupported_type(ZeroOnly, "counter"), ZeroOnly)
+            return weakref.ref(ZeroOnly)
+
+        unsupported = probe_local_type()
+        gc.collect()
+
+        assert unsupported() is None
+
+    def test_unhashable_unsupported_field_warns_once(self):
+        """Test that a field of an unhashable unsupported type warns only on its first mock."""
+
+        class UnhashableMeta(type):
+            __hash__ = None  # type: ignore[assignment]
+
+        class Unmockable(metaclass=UnhashableMeta):
+            def __init__(self, value):
+                raise ValueError("Cannot instantiate")
+
+        @dataclass
+        class ModelWithUnhashable:
+            blob: Unmockable
+
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter("always")
+            mocks = [mock_factory(ModelWithUnhashable) for _ in range(3)]
+        assert [mock.blob for mock in mocks] == [None] * 3
+        assert len(w) == 1
+
+    def test_mock_factory_with_unhashable_field_type(self):
+        """Test that a field whose type cannot be hashed falls back to None."""
+
+        class UnhashableMeta(type):
+            __hash__ = None  # type: ignore[assignment]
+
+        class Unmockable(metaclass=UnhashableMeta):
+            def __init__(self, value):
+                raise ValueError("Cannot instantiate")
+
+        @dataclass
+        class ModelWithUnhashable:
+            blob: Unmockable
+
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter("always")
+            assert mock_factory(ModelWithUnhashable).blob is None
+        assert "Unsupported type" in str(w[0].message)
+
     def test_mock_dataclass_with_missing_default(self):
         """Test mocking dataclass with fields that have MISSING default."""
 
@@ -128,6 +247,133 @@ class TestMockFactoryInternals:
         # Optional field might be None
         assert mock.optional is None or isinstance(mock.optional, str)
 
+    def test_field_plan_is_cached_per_class(self):
+        """Test that a class's field plan is built once and reused."""
+
+        @dataclass
+        class PlannedModel:
+            name: Varchar(20)
+            count: int
+
+        mock_factory(PlannedModel)
+        entry = _MODEL_PLANS[PlannedModel]
+        mock = mock_factory(PlannedModel, count=3)
+
+        assert _MODEL_PLANS[PlannedModel] is entry
+        plan, mock_function = entry
+        assert [field.name for field in plan] == ["name", "count"]
+        assert mock.count == 3
+        assert isinstance(mock_function(PlannedModel, {}), PlannedModel)
+
+    def test_cached_plan_does_not_keep_class_alive(self):
+        """Test that a mocked class can still be garbage collected."""
+
+        def make_model():
+            @dataclass
+            class Temporary:
+                name: str
+                count: Optional[int] = None
+
+            mock_factory(Temporary)
+            mock_factory(Temporary, name="x")
+            return weakref.ref(Temporary)
+
+        model = make_model()
+        gc.collect()
+
+        assert model() is None
+
+    def test_generated_constructor_is_shared_by_shape(self):
+        """Test that dataclasses with the same field shape share one compiled constructor."""
+
+        @dataclass
+        class Person:
+            name: str
+            age: int
+
+        @dataclass
+        class Product:
+            title: str
+            stock: int
+
+        mock_factory(Person)
+        factories = len(_CONSTRUCTOR_FACTORIES)
+        mock = mock_factory(Product)
+
+        assert len(_CONSTRUCTOR_FACTORIES) == factories
+        assert isinstance(mock.title, str)
+        assert isinstance(mock.stock, int)
+
+    def test_generated_constructor_respects_custom_init_order(self):
+        """Test that a custom __init__ ordering parameters unlike fields() gets keywords."""
+
+        @dataclass(init=False)
+        class Person:
+            name: str
+            age: int
+
+            def __init__(self, age, name):
+                self.name = name
+                self.age = age
+
+        mock = mock_factory(Person)
+        assert isinstance(mock.name, str)
+        assert isinstance(mock.age, int)
+
+    def test_generated_constructor_skips_init_vars(self):
+        """Test that InitVar parameters are not filled with other fields' values."""
+
+        @dataclass
+        class Scaled:
+            scale: InitVar[int] = 1
+            name: str = "d"
+
+            def __post_init__(self, scale):
+                self.scale_seen = scale
+
+        mock = mock_factory(Scaled)
+        assert mock.scale_seen == 1
+        assert isinstance(mock.name, str)
+
+    def test_generated_constructor_uses_default_for_none(self):
+        """Test that the no-override path falls back to defaults for None mocks."""
+
+        class NullMockProvider:
+            def mock(self):
+                return None
+
+        @dataclass
+        class ModelWithDefault:
+            value: Annotated[Optional[str], NullMockProvider()] = "fallback"
+
+        assert mock_factory(ModelWithDefault).value == "fallback"
+
+    def test_optional_fields_are_none_about_a_fifth_of_the_time(self):
+        """Test the batched None draw for Optional fields keeps the ~20% rate."""
+
+        @dataclass
+        class OptionalModel:
+            first: Optional[int]
+            second: Optional[str] = None
+
+        mocks = [mock_factory(OptionalModel) for _ in range(1000)]
+
+        assert 100 < sum(m.first is None for m in mocks) < 300
+        assert 100 < sum(m.second is None for m in mocks) < 300
+
+    def test_string_annotations_are_resolved(self):
+        """Test that string annotations resolve to their types once per class."""
+
+        @dataclass
+        class ForwardModel:
+            count: "int"
+            tag: "Optional[str]" = None
+
+        mocks = [mock_factory(ForwardModel) for _ in range(20)]
+
+        assert all(isinstance(m.count, int) for m in mocks)
+        assert all(m.tag is None or isinstance(m.tag, str) for m in mocks)
+
 
 class TestMockFactoryEdgeCases:
     """Test edge cases in mock factory."""
@@ -155,8 +401,6 @@ class TestMockFactoryEdgeCases:
             def mock(self):
                 return None
 
-        from typing import Annotated
-
         @dataclass
         class ModelWithNullType:
             nullable: Annotated[Optional[str], NullMockProvider()]
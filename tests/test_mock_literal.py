@@ -1,11 +1,14 @@
 """Tests for Literal type support in mock generation."""
 
+import random
 from dataclasses import dataclass
 from typing import Literal, Optional
 
 import pytest
 
-from mocksmith.mock_factory import mock_factory
+from mocksmith import seed, set_rng
+from mocksmith._random import get_rng
+from mocksmith.mock_factory import _choices_for, mock_factory
 
 try:
     from pydantic import BaseModel, Field
@@ -105,6 +108,19 @@ class TestLiteralWithDataclass:
             if mock.mode is not None:
                 assert mock.mode in ["read", "write", "read-write"]
 
+    def test_optional_literal_none_rate(self):
+        """Test that optional literals are None about a fifth of the time."""
+
+        @dataclass
+        class Feature:
+            mode: Optional[Literal["read", "write", "read-write"]]
+
+        seed(0)
+        modes = [mock_factory(Feature).mode for _ in range(1000)]
+
+        assert 150 < modes.count(None) < 250
+        assert {mode for mode in modes if mode is not None} == {"read", "write", "read-write"}
+
 
 @pytest.mark.skipif(not PYDANTIC_AVAILABLE, reason="Pydantic not installed")
 class TestLiteralWithPydantic:
@@ -270,6 +286,14 @@ class TestLiteralEdgeCases:
         maybe_values = {mock.maybe for mock in mocks}
         assert len(maybe_values) == 2
 
+    def test_literal_choices_are_shared(self):
+        """Test that fields with the same Literal annotation share one choice tuple."""
+        Status = Literal["active", "inactive"]
+
+        assert _choices_for(Status) is _choices_for(Literal["active", "inactive"])
+        assert _choices_for(Literal[1, 2]) == (1, 2)
+        assert _choices_for(int) is None
+
     def test_none_in_literal(self):
         """Test literal that includes None as a value."""
 
@@ -287,3 +311,23 @@ class TestLiteralEdgeCases:
         # Should have all three values
         states = {mock.state for mock in mocks}
         assert len(states) == 3
+
+    def test_literal_follows_replaced_generator(self):
+        """Test that cached Literal generators draw from a newly set generator."""
+
+        @dataclass
+        class Palette:
+            color: Literal["red", "green", "blue", "cyan"]
+            size: Literal["S", "L"]
+
+        original = get_rng()
+        try:
+            mock_factory(Palette)
+            set_rng(random.Random(11))
+            first = [mock_factory(Palette) for _ in range(10)]
+            set_rng(random.Random(11))
+            second = [mock_factory(Palette) for _ in range(10)]
+        finally:
+            set_rng(original)
+
+        assert first == second
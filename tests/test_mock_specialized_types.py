@@ -1,43 +1,74 @@
 """Tests for mock data generation in specialized types."""
 
+import pytest
+
+from mocksmith import seed
 from mocksmith.specialized import City, CountryCode, PhoneNumber, State, ZipCode
+from mocksmith.specialized.contact import Email
+
+
+# Default-length types are built once per module and shared by the tests below
+@pytest.fixture(scope="module")
+def country():
+    return CountryCode()
+
+
+@pytest.fixture(scope="module")
+def state():
+    return State()
+
+
+@pytest.fixture(scope="module")
+def city():
+    return City()
+
+
+@pytest.fixture(scope="module")
+def zipcode():
+    return ZipCode()
+
+
+@pytest.fixture(scope="module")
+def phone():
+    return PhoneNumber()
 
 
 class TestCountryCodeMock:
     """Test mock generation for CountryCode type."""
 
-    def test_country_code_mock_format(self):
+    def test_country_code_mock_format(self, country):
         """CountryCode should generate 2-letter ISO codes."""
-        country = CountryCode()
         mock_value = country.mock()
 
         assert isinstance(mock_value, str)
         assert len(mock_value) == 2
         assert mock_value.isupper()
 
-    def test_country_code_mock_validates(self):
+    def test_country_code_mock_validates(self, country):
         """Generated country codes should pass validation."""
-        country = CountryCode()
         mock_value = country.mock()
 
         # Should not raise
         country.validate(mock_value)
 
-    def test_country_code_generates_variety(self):
+    def test_country_code_generates_variety(self, country):
         """Should generate different country codes."""
-        country = CountryCode()
-        values = [country.mock() for _ in range(20)]
-
-        unique_values = set(values)
+        unique_values = set(country.mock_many(20))
         assert len(unique_values) > 5  # Should have variety
 
+    def test_country_code_mock_is_seeded(self, country):
+        """Seeding should make country code mocks reproducible."""
+        seed(3)
+        first = [country.mock() for _ in range(5)]
+        seed(3)
+        assert [country.mock() for _ in range(5)] == first
+
 
 class TestStateMock:
     """Test mock generation for State type."""
 
-    def test_state_mock_respects_length(self):
+    def test_state_mock_respects_length(self, state):
         """State mock should respect length constraint."""
-        state = State()  # Default 50 chars
         mock_value = state.mock()
 
         assert isinstance(mock_value, str)
@@ -50,9 +81,16 @@ class TestStateMock:
 
         assert len(mock_value) <= 30
 
-    def test_state_mock_validates(self):
+    def test_state_mock_many(self):
+        """mock_many should generate the requested number of valid states."""
+        state = State(length=5)
+        values = state.mock_many(10)
+
+        assert len(values) == 10
+        assert all(len(value) <= 5 for value in values)
+
+    def test_state_mock_validates(self, state):
         """Generated state should pass validation."""
-        state = State()
         mock_value = state.mock()
 
         # Should not raise
@@ -62,9 +100,8 @@ class TestStateMock:
 class TestCityMock:
     """Test mock generation for City type."""
 
-    def test_city_mock_format(self):
+    def test_city_mock_format(self, city):
         """City should generate reasonable city names."""
-        city = City()
         mock_value = city.mock()
 
         assert isinstance(mock_value, str)
@@ -78,9 +115,8 @@ class TestCityMock:
 
         assert len(mock_value) <= 50
 
-    def test_city_mock_validates(self):
+    def test_city_mock_validates(self, city):
         """Generated city should pass validation."""
-        city = City()
         mock_value = city.mock()
 
         # Should not raise
@@ -90,9 +126,8 @@ class TestCityMock:
 class TestZipCodeMock:
     """Test mock generation for ZipCode type."""
 
-    def test_zipcode_mock_format(self):
+    def test_zipcode_mock_format(self, zipcode):
         """ZipCode should generate postal codes."""
-        zipcode = ZipCode()
         mock_value = zipcode.mock()
 
         assert isinstance(mock_value, str)
@@ -100,9 +135,15 @@ class TestZipCodeMock:
         # Should contain numbers or alphanumeric
         assert any(c.isdigit() for c in mock_value)
 
-    def test_zipcode_mock_validates(self):
+    def test_zipcode_custom_length(self):
+        """ZipCode shorter than 5 characters should truncate the code."""
+        mock_value = ZipCode(3).mock()
+
+        assert len(mock_value) == 3
+        assert mock_value.isdigit()
+
+    def test_zipcode_mock_validates(self, zipcode):
         """Generated zip code should pass validation."""
-        zipcode = ZipCode()
         mock_value = zipcode.mock()
 
         # Should not raise
@@ -112,18 +153,53 @@ class TestZipCodeMock:
 class TestPhoneNumberMock:
     """Test mock generation for PhoneNumber type."""
 
-    def test_phone_mock_format(self):
+    def test_phone_mock_format(self, phone):
         """PhoneNumber should generate phone numbers."""
-        phone = PhoneNumber()
         mock_value = phone.mock()
 
         assert isinstance(mock_value, str)
         assert len(mock_value) <= 20  # Default length
 
-    def test_phone_mock_validates(self):
+    def test_phone_mock_validates(self, phone):
         """Generated phone number should pass validation."""
-        phone = PhoneNumber()
         mock_value = phone.mock()
 
         # Should not raise
         phone.validate(mock_value)
+
+
+class TestEmailMock:
+    """Test mock generation for Email type."""
+
+    def test_email_mock_format(self):
+        """Email should generate lowercase addresses with a domain."""
+        email = Email()
+        mock_value = email.mock()
+
+        local, _, domain = mock_value.partition("@")
+        assert local
+        assert "." in domain
+        assert mock_value == mock_value.lower()
+
+    def test_email_mock_with_domain(self):
+        """Email with a domain should generate addresses at that domain."""
+        email = Email(domain="company.com")
+        mock_value = email.mock()
+
+        assert mock_value.endswith("@company.com")
+        email.validate(mock_value)
+
+    def test_email_generates_unique_values(self):
+        """Email mocks should not repeat."""
+        email = Email()
+        values = email.mock_many(50)
+
+        assert len(set(values)) == 50
+
+    def test_email_mock_is_seeded(self):
+        """Seeding should make email mocks reproducible."""
+        email = Email()
+        seed(3)
+        first = email.mock_many(5)
+        seed(3)
+        assert email.mock_many(5) == first
@@ -1,45 +1,52 @@
 """Tests for mock data generation in string types using V3 pattern."""
 
+import sys
+
 import pytest
 
-from mocksmith import Char, Text, Varchar
+from mocksmith import Char, Text, Varchar, seed
+
+
+# Types used by several tests are built once per module
+@pytest.fixture(scope="module")
+def varchar10():
+    return Varchar(10)
+
+
+@pytest.fixture(scope="module")
+def varchar50():
+    return Varchar(50)
+
+
+@pytest.fixture(scope="module")
+def char5():
+    return Char(5)
+
+
+@pytest.fixture(scope="module")
+def char10():
+    return Char(10)
 
 
 class TestVARCHARMock:
     """Test mock generation for VARCHAR type."""
 
-    def test_varchar_mock_respects_length(self):
+    def test_varchar_mock_respects_length(self, varchar10):
         """Mock data should respect length constraint."""
-        VarcharType = Varchar(10)
-        mock_value = VarcharType.mock()
+        mock_value = varchar10.mock()
 
         assert isinstance(mock_value, str)
         assert len(mock_value) <= 10
 
-    def test_varchar_mock_various_lengths(self):
+    @pytest.mark.parametrize("length", [5, 50, 500], ids=["short", "medium", "long"])
+    def test_varchar_mock_various_lengths(self, length):
         """Test mock generation for different lengths."""
-        # Short VARCHAR
-        ShortType = Varchar(5)
-        short_mock = ShortType.mock()
-        assert len(short_mock) <= 5
-
-        # Medium VARCHAR
-        MediumType = Varchar(50)
-        medium_mock = MediumType.mock()
-        assert len(medium_mock) <= 50
-
-        # Long VARCHAR
-        LongType = Varchar(500)
-        long_mock = LongType.mock()
-        assert len(long_mock) <= 500
-
-    def test_varchar_mock_generates_different_values(self):
-        """Mock should generate different values on each call."""
-        VarcharType = Varchar(50)
-        values = [VarcharType.mock() for _ in range(10)]
+        assert len(Varchar(length).mock()) <= length
 
+    def test_varchar_mock_generates_different_values(self, varchar50):
+        """Mock should generate different values on each call."""
         # Should have at least some unique values
-        unique_values = set(values)
+        unique_values = set(varchar50.mock_many(10))
         assert len(unique_values) > 5
 
     def test_varchar_mock_validates(self):
@@ -93,33 +100,25 @@ class TestVARCHARMock:
 class TestCHARMock:
     """Test mock generation for CHAR type."""
 
-    def test_char_mock_exact_length(self):
+    def test_char_mock_exact_length(self, char10):
         """CHAR mock should always be exact length."""
-        CharType = Char(10)
-        mock_value = CharType.mock()
+        mock_value = char10.mock()
 
         assert isinstance(mock_value, str)
         assert len(mock_value) == 10  # Exact length
 
-    def test_char_mock_padding(self):
+    def test_char_mock_padding(self, char5):
         """CHAR should pad short values."""
-        CharType = Char(5)
-        mock_value = CharType.mock()
+        mock_value = char5.mock()
 
         # Should be padded to exact length
         assert len(mock_value) == 5
 
-    def test_char_mock_various_lengths(self):
+    # Very short CHAR (like country codes) and medium CHAR
+    @pytest.mark.parametrize("length", [2, 20], ids=["short", "medium"])
+    def test_char_mock_various_lengths(self, length):
         """Test CHAR mock for different lengths."""
-        # Very short CHAR (like country codes)
-        ShortType = Char(2)
-        short_mock = ShortType.mock()
-        assert len(short_mock) == 2
-
-        # Medium CHAR
-        MediumType = Char(20)
-        medium_mock = MediumType.mock()
-        assert len(medium_mock) == 20
+        assert len(Char(length).mock()) == length
 
     def test_char_mock_validates(self):
         """Generated mock data should pass validation."""
@@ -150,7 +149,8 @@ class TestCHARMock:
         # Test to_upper
         UpperType = Char(5, to_upper=True)
         mock_value = UpperType.mock()
-        assert mock_value.rstrip() == mock_value.rstrip().upper()
+        # Padding spaces are unaffected by upper(), so no need to strip them
+        assert mock_value == mock_value.upper()
         assert len(mock_value) == 5
 
 
@@ -174,17 +174,10 @@ class TestTEXTMock:
         assert isinstance(mock_value, str)
         assert len(mock_value) <= 100
 
-    def test_text_mock_various_limits(self):
+    @pytest.mark.parametrize("max_length", [50, 2000], ids=["small", "large"])
+    def test_text_mock_various_limits(self, max_length):
         """Test TEXT mock with various limits."""
-        # Small text
-        SmallType = Text(max_length=50)
-        small_mock = SmallType.mock()
-        assert len(small_mock) <= 50
-
-        # Large text
-        LargeType = Text(max_length=2000)
-        large_mock = LargeType.mock()
-        assert len(large_mock) <= 2000
+        assert len(Text(max_length=max_length).mock()) <= max_length
 
     def test_text_mock_validates(self):
         """Generated mock data should pass validation."""
@@ -239,26 +232,28 @@ class TestTEXTMock:
         mock_value = UpperType.mock()
         assert mock_value == mock_value.upper()
 
+    def test_text_mock_with_strip_whitespace_keeps_min_length(self):
+        """Stripped mocks should not end up shorter than min_length."""
+        seed(0)
+        StripType = Text(min_length=40, startswith="ab", strip_whitespace=True)
+        for _ in range(3000):
+            mock_value = StripType.mock()
+            assert len(mock_value) >= 40
+            assert StripType(mock_value) == mock_value
+
 
 class TestMockImportError:
     """Test behavior when faker is not installed."""
 
-    def test_import_error_message(self, monkeypatch):
+    def test_import_error_message(self, monkeypatch, varchar10):
         """Should provide helpful error when faker not installed."""
-        # Simulate faker not being installed
-        import builtins
-
-        original_import = builtins.__import__
-
-        def mock_import(name, *args, **kwargs):
-            if name == "faker" or name.startswith("faker."):
-                raise ImportError("No module named 'faker'")
-            return original_import(name, *args, **kwargs)
-
-        monkeypatch.setattr(builtins, "__import__", mock_import)
+        # Simulate faker not being installed; a None entry makes the import fail,
+        # and monkeypatch puts the already-imported module back afterwards
+        monkeypatch.setitem(sys.modules, "faker", None)
+        # Drop the shared Faker instance so mock() has to import faker again
+        monkeypatch.setattr("mocksmith._random._faker", None)
 
-        VarcharType = Varchar(10)
         with pytest.raises(ImportError) as exc_info:
-            VarcharType.mock()
+            varchar10.mock()
 
         assert "faker library is required for mock generation" in str(exc_info.value)
@@ -27,6 +27,7 @@ from mocksmith import (
     PositiveMoney,
     SmallInt,
     TinyInt,
+    _random,
     mock_factory,
 )
 from mocksmith.types.numeric import _INTEGER as INTEGER
@@ -46,47 +47,50 @@ class TestCriticalBugFix:
         # Create constrained TinyInt as reported in the bug
         my_tiny_int = TinyInt(gt=5)
 
-        # Generate many values to ensure none exceed bounds
-        for _ in range(1000):
+        # The exact boundaries are checked in test_bounds_respected
+        for _ in range(100):
             value = my_tiny_int.mock()
             assert value > 5, f"Value {value} should be greater than 5"
             assert value <= 127, f"CRITICAL BUG: Value {value} exceeds TINYINT max of 127!"
             assert value >= -128, f"Value {value} below TINYINT min of -128"
 
-    def test_tinyint_with_high_lower_bound(self):
-        """Test TinyInt with constraint near its maximum."""
-        my_tiny_int = TinyInt(gt=100, le=127)
-
-        for _ in range(100):
-            value = my_tiny_int.mock()
-            assert 100 < value <= 127, f"Value {value} not in range (100, 127]"
-
-    def test_smallint_bounds_respected(self):
-        """Test SmallInt never exceeds its SQL bounds."""
-        my_small_int = SmallInt(gt=30000)
-
-        for _ in range(100):
-            value = my_small_int.mock()
-            assert value > 30000, f"Value {value} should be greater than 30000"
-            assert value <= 32767, f"Value {value} exceeds SMALLINT max of 32767"
-
-    def test_integer_bounds_respected(self):
-        """Test Integer respects 32-bit bounds."""
-        my_integer = Integer(gt=2000000000)  # Near max
-
-        for _ in range(100):
-            value = my_integer.mock()
-            assert value > 2000000000
-            assert value <= 2147483647, f"Value {value} exceeds INTEGER max"
-
-    def test_bigint_bounds_respected(self):
-        """Test BigInt respects 64-bit bounds."""
-        my_big_int = BigInt(gt=9000000000000000000)  # Near max
-
-        for _ in range(100):
-            value = my_big_int.mock()
-            assert value > 9000000000000000000
-            assert value <= 9223372036854775807, f"Value {value} exceeds BIGINT max"
+    def test_mock_many_respects_multiple_of(self):
+        """Batched mocks land on valid multiples, including for unbounded BIGINT."""
+        assert all(value % 7 == 0 for value in SmallInt(ge=3, multiple_of=7).mock_many(200))
+        assert all(isinstance(value, int) for value in BigInt().mock_many(10))
+
+    def test_mock_many_is_uniform_over_wide_ranges_without_numpy(self, monkeypatch):
+        """The stdlib batch path reaches every low bit of a wide range."""
+        monkeypatch.setattr(_random, "NUMPY_AVAILABLE", False)
+        values = BigInt(ge=0, le=2**62).mock_many(2000)
+        assert all(0 <= value <= 2**62 for value in values)
+        assert any(value % 2 for value in values)
+        assert any(value % 512 for value in values)
+
+    @pytest.mark.parametrize(
+        "int_type, low, high",
+        [
+            (TinyInt(gt=5), 6, 127),
+            (TinyInt(gt=100, le=127), 101, 127),
+            (TinyInt(ge=-128, lt=-120), -128, -121),
+            (SmallInt(gt=30000), 30001, 32767),
+            (Integer(gt=2000000000), 2000000001, 2147483647),
+            (BigInt(gt=9000000000000000000), 9000000000000000001, 9223372036854775807),
+        ],
+        ids=["tinyint-gt", "tinyint-top", "tinyint-bottom", "smallint", "integer", "bigint"],
+    )
+    def test_bounds_respected(self, int_type, low, high):
+        """Mocks stay within SQL bounds, and the range ends exactly at the tightest valid values."""
+        assert int_type._mock_bounds() == (low, high, 1)
+        assert all(low <= value <= high for value in int_type.mock_many(500))
+        assert all(low <= int_type.mock() <= high for _ in range(20))
+
+        # Both endpoints are valid, and the values just outside them are not
+        assert int_type(low) == low
+        assert int_type(high) == high
+        for outside in (low - 1, high + 1):
+            with pytest.raises(ValueError):
+                int_type(outside)
 
 
 class TestInstantiationValidation:
@@ -331,6 +335,7 @@ class TestConstraintCombinations:
 
         # Should only generate 126 and 127
         assert values == {126, 127}
+        assert set(narrow_tiny.mock_many(50)) == {126, 127}
 
     def test_single_valid_value(self):
         """Test constraint that allows only one value."""
@@ -531,6 +536,7 @@ class TestMockGenerationStatistics:
         # Check that we get all possible values (1-10)
         unique_values = set(values)
         assert unique_values == set(range(1, 11))
+        assert set(my_int.mock_many(1000)) == set(range(1, 11))
 
         # Check reasonable distribution (no value should dominate)
         from collections import Counter
@@ -546,26 +552,25 @@ class TestMockGenerationStatistics:
         high_tiny = TinyInt(ge=120, le=127)
         values = {high_tiny.mock() for _ in range(100)}
         assert values.issubset(set(range(120, 128)))
+        assert set(high_tiny.mock_many(100)).issubset(set(range(120, 128)))
 
         # Near TINYINT minimum
         low_tiny = TinyInt(ge=-128, le=-120)
         values = {low_tiny.mock() for _ in range(100)}
         assert values.issubset(set(range(-128, -119)))
+        assert set(low_tiny.mock_many(100)).issubset(set(range(-128, -119)))
 
     def test_decimal_mock_generation(self):
         """Test that decimal mock generation works correctly."""
-        my_decimal = DecimalType(10, 2, ge=Decimal("0.01"), le=Decimal("999.99"))
+        low, high = Decimal("0.01"), Decimal("999.99")
+        my_decimal = DecimalType(10, 2, ge=low, le=high)
 
         for _ in range(100):
             value = my_decimal.mock()
-            assert value >= Decimal("0.01")
-            assert value <= Decimal("999.99")
+            assert low <= value <= high
 
             # Check scale (max 2 decimal places)
-            str_val = str(value)
-            if "." in str_val:
-                decimal_places = len(str_val.split(".")[1])
-                assert decimal_places <= 2
+            assert -value.as_tuple().exponent <= 2
 
 
 if __name__ == "__main__":
@@ -1,9 +1,12 @@
 """Tests for numeric database types V3 implementation."""
 
+import random
 from decimal import Decimal
 
 import pytest
 
+from mocksmith import set_rng
+from mocksmith._random import get_rng
 from mocksmith.types.numeric import _BIGINT as BIGINT
 from mocksmith.types.numeric import _DECIMAL as DECIMAL
 from mocksmith.types.numeric import _DOUBLE as DOUBLE
@@ -53,72 +56,48 @@ class TestINTEGER:
         assert ConstrainedInt._le == 100
         assert ConstrainedInt._multiple_of == 5
 
-    def test_validation_success(self):
-        # Creating instances validates the value
-        assert INTEGER(0) == 0
-        assert INTEGER(100) == 100
-        assert INTEGER(-100) == -100
-        assert INTEGER(2147483647) == 2147483647  # max value
-        assert INTEGER(-2147483648) == -2147483648  # min value
-        assert INTEGER(100.0) == 100  # float with no decimal
-
-    def test_validation_with_constraints(self):
-        # Test gt constraint
-        PositiveInt = Integer(gt=0)
-        assert PositiveInt(1) == 1
-        assert PositiveInt(100) == 100
-
-        with pytest.raises(ValueError, match="greater than 0"):
-            PositiveInt(0)
-        with pytest.raises(ValueError, match="greater than 0"):
-            PositiveInt(-1)
-
-        # Test ge constraint
-        NonNegInt = Integer(ge=0)
-        assert NonNegInt(0) == 0
-        assert NonNegInt(100) == 100
-
-        with pytest.raises(ValueError, match="greater than or equal to 0"):
-            NonNegInt(-1)
-
-        # Test lt constraint
-        SmallInt = Integer(lt=100)
-        assert SmallInt(99) == 99
-        assert SmallInt(0) == 0
-
-        with pytest.raises(ValueError, match="less than 100"):
-            SmallInt(100)
-
-        # Test le constraint
-        MaxInt = Integer(le=100)
-        assert MaxInt(100) == 100
-        assert MaxInt(0) == 0
-
-        with pytest.raises(ValueError, match="less than or equal to 100"):
-            MaxInt(101)
-
-        # Test multiple_of constraint
-        EvenInt = Integer(multiple_of=2)
-        assert EvenInt(2) == 2
-        assert EvenInt(100) == 100
-
-        with pytest.raises(ValueError, match="multiple of 2"):
-            EvenInt(3)
-
-    def test_validation_failure(self):
-        # Out of range
-        with pytest.raises(ValueError, match="out of INTEGER range"):
-            INTEGER(2147483648)  # max + 1
-        with pytest.raises(ValueError, match="out of INTEGER range"):
-            INTEGER(-2147483649)  # min - 1
-
-        # Invalid types
-        with pytest.raises(ValueError):
-            INTEGER("not a number")
-        with pytest.raises(ValueError):
-            INTEGER([1, 2, 3])
+    # Creating instances validates the value; 100.0 is a float with no decimal
+    @pytest.mark.parametrize("value", [0, 100, -100, 2147483647, -2147483648, 100.0])
+    def test_validation_success(self, value):
+        assert INTEGER(value) == value
+
+    @pytest.mark.parametrize(
+        "constraints, values",
+        [
+            ({"gt": 0}, [1, 100]),
+            ({"ge": 0}, [0, 100]),
+            ({"lt": 100}, [99, 0]),
+            ({"le": 100}, [100, 0]),
+            ({"multiple_of": 2}, [2, 100]),
+        ],
+        ids=["gt", "ge", "lt", "le", "multiple_of"],
+    )
+    def test_constraints_accept(self, constraints, values):
+        ConstrainedInt = Integer(**constraints)
+        for value in values:
+            assert ConstrainedInt(value) == value
+
+    @pytest.mark.parametrize(
+        "constraints, value, message",
+        [
+            ({"gt": 0}, 0, "greater than 0"),
+            ({"gt": 0}, -1, "greater than 0"),
+            ({"ge": 0}, -1, "greater than or equal to 0"),
+            ({"lt": 100}, 100, "less than 100"),
+            ({"le": 100}, 101, "less than or equal to 100"),
+            ({"multiple_of": 2}, 3, "multiple of 2"),
+        ],
+        ids=["gt-zero", "gt-negative", "ge", "lt", "le", "multiple_of"],
+    )
+    def test_constraints_reject(self, constraints, value, message):
+        with pytest.raises(ValueError, match=message):
+            Integer(**constraints)(value)
+
+    # Out-of-range values are covered by TestIntegerRanges
+    @pytest.mark.parametrize("value", ["not a number", [1, 2, 3], None])
+    def test_validation_failure(self, value):
         with pytest.raises(ValueError):
-            INTEGER(None)
+            INTEGER(value)
 
     def test_serialize(self):
         value = INTEGER(100)
@@ -126,48 +105,31 @@ class TestINTEGER:
         assert int(value) == 100
 
 
-class TestBIGINT:
-    def test_range(self):
-        # Test BIGINT specific range
-        value = BIGINT(9223372036854775807)  # max
-        assert value == 9223372036854775807
-
-        value = BIGINT(-9223372036854775808)  # min
-        assert value == -9223372036854775808
-
-        with pytest.raises(ValueError):
-            BIGINT(9223372036854775808)  # overflow
-
-
-class TestSMALLINT:
-    def test_range(self):
-        # Test SMALLINT specific range
-        value = SMALLINT(32767)  # max
-        assert value == 32767
+@pytest.mark.parametrize(
+    "int_type, sql_type, min_val, max_val",
+    [
+        (TINYINT, "TINYINT", -128, 127),
+        (SMALLINT, "SMALLINT", -32768, 32767),
+        (INTEGER, "INTEGER", -2147483648, 2147483647),
+        (BIGINT, "BIGINT", -9223372036854775808, 9223372036854775807),
+    ],
+    ids=["tinyint", "smallint", "integer", "bigint"],
+)
+class TestIntegerRanges:
+    def test_range(self, int_type, sql_type, min_val, max_val):
+        assert int_type(max_val) == max_val
+        assert int_type(min_val) == min_val
 
-        value = SMALLINT(-32768)  # min
-        assert value == -32768
+        with pytest.raises(ValueError, match=f"out of {sql_type} range"):
+            int_type(max_val + 1)  # overflow
+        with pytest.raises(ValueError, match=f"out of {sql_type} range"):
+            int_type(min_val - 1)  # underflow
 
-        with pytest.raises(ValueError, match="out of SMALLINT range"):
-            SMALLINT(32768)  # overflow
+    def test_sql_type(self, int_type, sql_type, min_val, max_val):
+        assert int_type(0).sql_type == sql_type
 
 
 class TestTINYINT:
-    def test_range(self):
-        # Test TINYINT specific range
-        value = TINYINT(127)  # max
-        assert value == 127
-
-        value = TINYINT(-128)  # min
-        assert value == -128
-
-        with pytest.raises(ValueError, match="out of TINYINT range"):
-            TINYINT(128)  # overflow
-
-    def test_sql_type(self):
-        value = TINYINT(10)
-        assert value.sql_type == "TINYINT"
-
     def test_python_type(self):
         value = TINYINT(10)
         assert isinstance(value, int)
@@ -303,17 +265,14 @@ class TestFLOAT:
         with pytest.raises(ValueError, match="greater than 0"):
             PositiveFloat(-10.5)
 
-    def test_validation_with_constraints(self):
-        BoundedFloat = Float(ge=-100, le=100)
-
-        assert BoundedFloat(0) == 0
-        assert BoundedFloat(100) == 100
-        assert BoundedFloat(-100) == -100
+    @pytest.mark.parametrize("value", [0, 100, -100])
+    def test_constraints_accept(self, value):
+        assert Float(ge=-100, le=100)(value) == value
 
+    @pytest.mark.parametrize("value", [101, -101])
+    def test_constraints_reject(self, value):
         with pytest.raises(ValueError):
-            BoundedFloat(101)
-        with pytest.raises(ValueError):
-            BoundedFloat(-101)
+            Float(ge=-100, le=100)(value)
 
     def test_serialize(self):
         value = FLOAT(123.45)
@@ -328,6 +287,15 @@ class TestREAL:
         assert isinstance(value, float)
         assert value.sql_type == "REAL"
 
+    @pytest.mark.parametrize("value", [3.4e38, -3.4e38, 1e-39])
+    def test_precision_limits_accepted(self, value):
+        assert REAL(value) == value
+
+    @pytest.mark.parametrize("value", [3.5e38, -3.5e38, float("inf")])
+    def test_precision_limits_rejected(self, value):
+        with pytest.raises(ValueError, match="out of range"):
+            REAL(value)
+
 
 class TestDOUBLE:
     def test_creation(self):
@@ -379,6 +347,21 @@ class TestSpecializedTypes:
         with pytest.raises(ValueError, match="greater than or equal to 0"):
             NonNegMoney("-10")
 
+    def test_constrained_types_are_cached(self):
+        # Same constraints give back the same class, so schemas are built once
+        assert TinyInt(gt=5) is TinyInt(gt=5)
+        assert TinyInt(gt=5) is not TinyInt(ge=5)
+        assert DecimalType(10, 2, ge=0) is DecimalType(10, 2, ge=0)
+        assert Float(le=1.5) is Float(le=1.5)
+        assert PositiveInteger() is Integer(gt=0)
+        # Equal but differently typed bounds keep their own class
+        assert DecimalType(10, 2, gt=1) is not DecimalType(10, 2, gt=1.0)
+
+    def test_values_have_no_instance_dict(self):
+        # Constraints live on the class, so values carry no per-instance __dict__
+        for value in (TinyInt(gt=5)(6), INTEGER(1), DecimalType(5, 2)("1.5"), Float(ge=0)(1.0)):
+            assert not hasattr(value, "__dict__")
+
 
 class TestMockGeneration:
     def test_integer_mock(self):
@@ -392,12 +375,32 @@ class TestMockGeneration:
         for _ in range(10):
             value = SmallPosInt.mock()
             assert 1 <= value <= 100
+        assert all(1 <= value <= 100 for value in SmallPosInt.mock_many(10))
 
     def test_tinyint_mock(self):
         TinyType = TinyInt()
         for _ in range(10):
             value = TinyType.mock()
             assert -128 <= value <= 127
+        assert all(-128 <= value <= 127 for value in TinyType.mock_many(10))
+
+    def test_full_range_mock_reaches_both_ends(self):
+        # 256 values, so drawn straight from getrandbits(8)
+        values = {TinyInt().mock() for _ in range(5000)}
+        assert values == set(range(-128, 128))
+
+    def test_integer_mock_follows_set_rng(self):
+        IntType = Integer()
+        original = get_rng()
+        try:
+            set_rng(random.Random(7))
+            first = [IntType.mock() for _ in range(5)]
+            set_rng(random.Random(7))
+            second = [IntType.mock() for _ in range(5)]
+        finally:
+            set_rng(original)
+
+        assert first == second
 
     def test_decimal_mock(self):
         MoneyType = DecimalType(10, 2)
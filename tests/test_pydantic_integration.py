@@ -1,30 +1,27 @@
 """Tests for Pydantic integration."""
 
+from datetime import date
+from decimal import Decimal
 from typing import Optional
 
 import pytest
 
 from mocksmith import Boolean, Date, DecimalType, Integer, PositiveInteger, Varchar
 
-try:
-    from pydantic import BaseModel, ValidationError
+pydantic = pytest.importorskip("pydantic", reason="Pydantic not installed")
+BaseModel = pydantic.BaseModel
+ValidationError = pydantic.ValidationError
 
-    PYDANTIC_AVAILABLE = True
-except ImportError:
-    PYDANTIC_AVAILABLE = False
-    pytest.skip("Pydantic not installed", allow_module_level=True)
 
-from datetime import date
-from decimal import Decimal
+# Built once at import and shared by the tests that only need a simple model
+class User(BaseModel):
+    name: Varchar(50)
+    age: Integer()
+    active: Boolean()
 
 
 class TestPydanticIntegration:
     def test_basic_model(self):
-        class User(BaseModel):
-            name: Varchar(50)
-            age: Integer()
-            active: Boolean()
-
         # Valid data
         user = User(name="John", age=30, active=True)
         assert user.name == "John"
@@ -91,12 +88,7 @@ class TestPydanticIntegration:
 
     def test_db_model_base(self):
         """Test model with database types."""
-
-        class User(BaseModel):
-            name: Varchar(50)
-            age: Integer()
-
-        user = User(name="Bob", age=25)
+        user = User(name="Bob", age=25, active=False)
 
         # Check values
         assert user.name == "Bob"
@@ -104,7 +96,7 @@ class TestPydanticIntegration:
 
         # Check that validation works
         with pytest.raises(ValidationError):
-            User(name="x" * 51, age=25)  # name too long
+            User(name="x" * 51, age=25, active=False)  # name too long
 
     def test_annotated_fields_with_defaults(self):
         class Product(BaseModel):
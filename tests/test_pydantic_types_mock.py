@@ -60,6 +60,22 @@ class TestPydanticTypesMocking:
         # This will raise if invalid
         NetworkModel(website=model.website, ip_address=model.ip_address)
 
+    def test_email_type(self):
+        """Test mocking of EmailStr."""
+        pytest.importorskip("email_validator")
+        from pydantic import EmailStr
+
+        @self.mockable
+        class ContactModel(self.BaseModel):
+            email: EmailStr
+
+        for _ in range(10):
+            email = ContactModel.mock().email
+            # Local part, "@", then a dotted domain
+            at = email.rfind("@")
+            assert at > 0
+            assert email.find(".", at) > at + 1
+
     def test_numeric_constraint_types(self):
         """Test mocking of numeric constraint types."""
 